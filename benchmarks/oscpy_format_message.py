@@ -0,0 +1,33 @@
+"""Compare oscpy's message formatting with and without the template cache.
+
+run with: python benchmarks/oscpy_format_message.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'server'))
+
+from oscpy import parser
+
+MESSAGES = (
+    ('single float', b'/object/location/x', [0.5]),
+    ('vector', b'/object/location', [0.5, 1.5, 2.5]),
+    ('mixed', b'/object/name', [b'Cube', 1, 0.25, True]),
+    ('64 floats', b'/mesh/weights', [i * 0.5 for i in range(64)]),
+)
+
+
+def main(number=20000):
+    print('{:<14}{:>14}{:>14}{:>10}'.format('message', 'uncached (us)', 'cached (us)', 'speedup'))
+    for name, address, values in MESSAGES:
+        assert parser.format_message(address, values)[0] == parser._format_message(address, values)[0]
+        uncached = min(timeit.repeat(lambda: parser._format_message(address, values), number=number, repeat=3))
+        cached = min(timeit.repeat(lambda: parser.format_message(address, values, reuse_buffer=True), number=number, repeat=3))
+        print('{:<14}{:>14.2f}{:>14.2f}{:>9.1f}x'.format(
+            name, uncached / number * 1e6, cached / number * 1e6, uncached / cached))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""Compare sending many oscpy messages one by one and with send_many.
+
+send_many uses sendmmsg on linux, a loop elsewhere.
+
+run with: python benchmarks/oscpy_send_many.py
+"""
+
+import os
+import socket
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'server'))
+
+from oscpy.client import OSCClient
+
+
+def main(count=400, number=50):
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(('127.0.0.1', 0))
+    receiver.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 22)
+    receiver.setblocking(False)
+    client = OSCClient('127.0.0.1', receiver.getsockname()[1], connect=True)
+    messages = [(b'/led/%d' % i, [i * 0.5, i, 1.0]) for i in range(count)]
+
+    def drain():
+        try:
+            while True:
+                receiver.recv(65535)
+        except BlockingIOError:
+            pass
+
+    def one_by_one():
+        for address, values in messages:
+            client.send_message(address, values)
+        drain()
+
+    def send_many():
+        client.send_many(messages)
+        drain()
+
+    print('{} messages per tick'.format(count))
+    for name, send in (('send_message', one_by_one), ('send_many', send_many)):
+        elapsed = min(timeit.repeat(send, number=number, repeat=3)) / number
+        print('{:<14}{:>10.3f} ms'.format(name, elapsed * 1e3))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,34 @@
+"""Time pythonosc's parsing of float messages of growing sizes.
+
+The time per argument should stay constant as messages get longer.
+
+run with: python benchmarks/pythonosc_parse_floats.py
+"""
+
+import os
+import struct
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'server'))
+
+from pythonosc.osc_message import OscMessage
+
+
+def float_message(count):
+    tags = b',' + b'f' * count + b'\x00'
+    tags += b'\x00' * (-len(tags) % 4)
+    return b'/points\x00' + tags + struct.pack('>%if' % count, *(float(i) for i in range(count)))
+
+
+def main(repeat=5):
+    print('{:>10}{:>14}{:>14}'.format('arguments', 'message (ms)', 'per arg (us)'))
+    for count in (10, 100, 1000, 5000):
+        dgram = float_message(count)
+        number = max(1, 20000 // count)
+        elapsed = min(timeit.repeat(lambda: OscMessage(dgram), number=number, repeat=repeat)) / number
+        print('{:>10}{:>14.3f}{:>14.3f}'.format(count, elapsed * 1e3, elapsed / count * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -77,6 +77,8 @@ def nodes_createCollections():
             item.osc_direction = itemN.osc_direction
             item.node_data_type = itemN.node_data_type
             item.node_type = itemN.node_type
+            item.rate = itemN.rate
+            item.filter_repetition = itemN.filter_repetition
     for itemN in bpy.context.scene.NodeOSC_keys:
         if itemN.enabled and itemN.osc_direction != "INPUT":
             item = bpy.context.scene.NodeOSC_outputs.add()
@@ -88,6 +90,8 @@ def nodes_createCollections():
             item.osc_direction = itemN.osc_direction
             item.node_data_type = itemN.node_data_type
             item.node_type = itemN.node_type
+            item.rate = itemN.rate
+            item.filter_repetition = itemN.filter_repetition
        
 
 
@@ -8,14 +8,29 @@ nodeUpdateItems = {
     ("EACH", "on each message", "Node Tree is executed on each message (ideal for low frequency messages)", "NONE", 0),
     ("MESSAGE", "on specific message", "Node Tree is executed on a specific message (ideal for high frequency messages)", "NONE", 1) }
 
+outputTriggerItems = {
+    ("TIMER", "on timer", "The outputs are checked for changes at the output rate", "NONE", 0),
+    ("DEPSGRAPH", "on scene update", "The outputs of the updated data-blocks are sent after each scene update and frame change (nothing is sent while the scene is idle)", "NONE", 1) }
+
 class NodeOSCEnvVarSettings(bpy.types.PropertyGroup):
     udp_in: bpy.props.StringProperty(default="127.0.0.1", description='The IP of this machine (on which blender is running)')
     udp_out: bpy.props.StringProperty(default="127.0.0.1", description='The IP of the machine to send messages to (can be the same if you want to send it to another application that runs on this machine)')
     port_in: bpy.props.IntProperty(default=9001, min=0, max=65535, description='The input network port (0-65535)')
     port_out: bpy.props.IntProperty(default=9002, min=0, max= 65535, description='The output network port (0-65535)')
     input_rate: bpy.props.IntProperty(default=0 ,description="The refresh rate of checking for input messages (millisecond)", min=0)
-    output_rate: bpy.props.IntProperty(default=40 ,description="The refresh rate of sending output messages (millisecond)", min=1)
+    input_latency_max: bpy.props.IntProperty(default=0, min=0, description="Without incoming messages, input checks are spaced out up to this interval, the longest a new message may wait to be executed (millisecond). 0 checks at the input rate")
+    input_cpu_max: bpy.props.IntProperty(default=100, min=1, max=100, subtype='PERCENTAGE', description="The input checks are spaced out so that executing the received messages takes at most this share of the time. 100 disables it")
+    input_interval: bpy.props.FloatProperty(default=0.0, description="The interval between input checks currently used (millisecond), updated while monitoring")
+    input_array_threshold: bpy.props.IntProperty(default=0, min=0, description="Messages with at least this many arguments, all floats or all ints, are received as a single array (numpy if available). 0 disables it")
+    input_timetag_offset: bpy.props.FloatProperty(default=0.0, description="Received bundles with a future timetag are executed at their time, shifted by this offset (millisecond, can be negative) to compensate for the network latency")
+    output_trigger: bpy.props.EnumProperty(name = "output trigger", default = "TIMER", items = outputTriggerItems)
+    output_rate: bpy.props.IntProperty(default=40 ,description="The refresh rate of sending output messages (millisecond). Outputs can override it with their own rate", min=1)
+    output_rates: bpy.props.StringProperty(default="", description="The achieved rate of each output rate")
     repeat_filter: bpy.props.BoolProperty(default=False ,description="When sending data, enable filtering repeating messages")
+    output_bundle: bpy.props.BoolProperty(default=False, description="Send all the output messages of an update packed into OSC bundles")
+    output_bundle_size: bpy.props.IntProperty(default=1472, min=64, max=65507, description="The maximal size of an output bundle (bytes). Bigger updates are split into several bundles. Keep it below the network MTU to avoid fragmentation")
+    output_sndbuf: bpy.props.IntProperty(default=0, min=0, description="The size of the send buffer of the output socket (bytes). Bigger buffers absorb bursts of output messages. 0 keeps the system default")
+    output_deadband: bpy.props.FloatProperty(default=0.0, min=0.0, description="Numeric output values are only sent if they changed by more than this amount")
     isUIExpanded: bpy.props.BoolProperty(default=True, description='Shows the detailed settings inside the UI panel')
     isServerRunning: bpy.props.BoolProperty(default=False, description='Show if the engine is running or not')
     message_monitor: bpy.props.BoolProperty(description="Display the current value of your keys, the last message received and some infos in console")
@@ -6,44 +6,406 @@ import socket
 import errno
 import mathutils
 import traceback
+import threading
 from math import radians
+from array import array
 from bpy.props import *
 from ast import literal_eval as make_tuple
 
 from .callbacks import *
 from ..nodes.nodes import *
 
-def make_osc_messages(myOscKeys, myOscMsg):
-    envars = bpy.context.scene.nodeosc_envars
-    for item in myOscKeys:        
-        if item.dp_format_enable == False:
-            # we cannot deal with a datapath string that has format syntax
-            #print( "sending  :{}".format(item) )
-            prop = eval(item.data_path)
-            
-            # now make the values to be sent a tuple (unless its a string or None)
-            if isinstance(prop, (bool, int, float)):
-                prop = (prop,)
-            elif prop is None:
+#######################################
+#  Output Snapshot                    #
+#######################################
+
+# an output handler with its data-path accessor resolved once
+class OSCOutputEntry(object):
+    __slots__ = ('index', 'slot', 'address', 'dataPath', 'owner', 'ownerId', 'ownerName', 'prop', 'code', 'indices', 'filtered', 'previous', 'previousObject', 'idPointer', 'rate')
+
+    def __init__(self, index, slot, item):
+        self.index = index                  # index inside the NodeOSC_outputs collection
+        self.slot = slot                    # index inside the snapshot buffers
+        self.address = item.osc_address
+        self.dataPath = item.data_path
+        # changes of the handler settings are taken into account at the next server start
+        self.filtered = item.filter_repetition
+        self.rate = item.rate               # millisecond, 0 for the global output rate
+        self.previous = None                # last sent numeric values
+        self.previousObject = None          # last sent non numeric value
+
+        try:
+            self.code = compile(item.data_path, item.data_path, 'eval')
+        except SyntaxError:
+            # the error will be reported when the output is evaluated
+            self.code = item.data_path
+
+        self.resolve()
+
+        # make sure the osc indices are a tuple
+        indices = make_tuple(item.osc_index)
+        if isinstance(indices, int): 
+            indices = (indices,)
+        self.indices = indices
+
+    # resolves the owner of the property. called again after an undo or a file load
+    def resolve(self):
+        self.owner = None                   # the resolved owner of the property, if it can be kept
+        self.ownerId = None                 # the data-block of the owner ...
+        self.ownerName = None               # ... and its name at resolution, to detect renames
+        self.prop = None
+
+        # properties of data-blocks like bpy.data.objects['Cube'].location can be
+        #   read directly from their owner, as long as its data-block keeps its name
+        data_path = self.dataPath
+        if data_path.startswith('bpy.data.') and data_path[-1] not in ')]':
+            try:
+                datapath = data_path[0:data_path.rindex('.')]
+                prop = data_path[data_path.rindex('.') + 1:]
+                owner = eval(datapath)
+                getattr(owner, prop)
+                self.ownerId = owner.id_data
+                self.ownerName = self.ownerId.name
+                self.owner = owner
+                self.prop = prop
+            except Exception:
+                self.owner = None
+
+        # the data-block owning the property, to know which scene updates concern 
+        #   this output. None if unknown, the output is then evaluated on every update
+        owner = self.owner
+        if owner is None and '.' in data_path:
+            try:
+                owner = eval(data_path[0:data_path.rindex('.')])
+            except Exception:
+                owner = None
+        try:
+            self.idPointer = owner.id_data.as_pointer()
+        except Exception:
+            self.idPointer = None
+
+    def read(self):
+        if self.owner is not None:
+            try:
+                if self.ownerId.name == self.ownerName:
+                    return getattr(self.owner, self.prop)
+            except ReferenceError:
+                pass
+            # the data-block has been renamed or removed: from now on the data-path 
+            #   is evaluated, which reports the error if it does not resolve anymore
+            self.owner = None
+        return eval(self.code)
+
+    # returns True if the value differs from the last sent value by more than the deadband
+    def update(self, value, deadband):
+        if value.__class__ is tuple:
+            previous = self.previous
+            if previous is not None and len(previous) == len(value):
+                try:
+                    for new, old in zip(value, previous):
+                        if abs(new - old) > deadband:
+                            break
+                    else:
+                        return False
+                except TypeError:
+                    pass
+            try:
+                self.previous = array('d', value)
+                self.previousObject = None
+                return True
+            except TypeError:
+                self.previous = None
+
+        # strings, None and mixed values are compared as they are
+        if self.previousObject is not None and value == self.previousObject:
+            return False
+        self.previousObject = value
+        return True
+
+# resolves the accessors of all the output handlers once. the main thread 
+# only reads the raw values into the slots of a buffer allocated once, the 
+# sender thread detects the changes against the last sent values and builds
+# the messages (see OSCOutputSender).
+class OSCOutputSnapshot(object):
+
+    def __init__(self, myOscKeys):
+        self.entries = []
+        self.idEntries = {}                 # data-block pointer -> the entries it owns
+        self.unindexed = []                 # the entries without a known owner
+        for index, item in enumerate(myOscKeys):
+            if item.dp_format_enable == False:
+                # we cannot deal with a datapath string that has format syntax
+                self.entries.append(OSCOutputEntry(index, len(self.entries), item))
+        self.index()
+        # the buffer filled by the main thread, one slot per entry. None marks a slot not read
+        self.values = self.buffer()
+
+    # the owners of the entries can not be trusted after an undo or a file load
+    def watch(self):
+        for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post, bpy.app.handlers.load_post):
+            handlers.append(self.onReload)
+
+    def unwatch(self):
+        for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post, bpy.app.handlers.load_post):
+            if self.onReload in handlers:
+                handlers.remove(self.onReload)
+
+    # resolves the owners again and rebuilds the index of their data-blocks
+    def onReload(self, *args):
+        for entry in self.entries:
+            entry.resolve()
+        self.index()
+
+    def index(self):
+        self.idEntries = {}
+        self.unindexed = []
+        for entry in self.entries:
+            if entry.idPointer is None:
+                self.unindexed.append(entry)
+            else:
+                self.idEntries.setdefault(entry.idPointer, []).append(entry)
+
+    def buffer(self):
+        return [None] * len(self.entries)
+
+    # the entries concerned by the updates of the data-blocks (pointers of the 
+    #   original IDs), in the order of the collection
+    def updatedEntries(self, idPointers):
+        entries = list(self.unindexed)
+        for idPointer in idPointers:
+            owned = self.idEntries.get(idPointer)
+            if owned is not None:
+                entries += owned
+        entries.sort(key=lambda entry: entry.index)
+        return entries
+
+    # called by the main thread: reads the values of the entries (all of them if None) 
+    #   into self.values. returns the number of values read
+    def collect(self, entries = None):
+        envars = bpy.context.scene.nodeosc_envars
+        outputs = bpy.context.scene.NodeOSC_outputs if envars.repeat_filter else None
+        values = self.values
+        count = 0
+        for entry in (self.entries if entries is None else entries):
+            if outputs is not None and entry.filtered:
+                continue
+
+            prop = entry.read()
+
+            # copy what is not a plain value, it might change until it is sent
+            if prop is None:
                 prop = 'None'
-            elif isinstance(prop, (mathutils.Vector, mathutils.Quaternion, mathutils.Euler, mathutils.Matrix)):
+            elif not isinstance(prop, (bool, int, float, str, tuple)):
                 prop = tuple(prop)
-            
-            stringProp = str(prop)
-            
-            if not (item.filter_repetition and envars.repeat_filter) and stringProp != item.value:
-                item.value = stringProp
-
-                # make sure the osc indices are a tuple
-                indices = make_tuple(item.osc_index)
-                if isinstance(indices, int): 
-                    indices = (indices,)
-                    
+            values[entry.slot] = prop
+            count += 1
+        return count
+
+    # called by the sender thread: gathers the changed values of the buffer into 
+    #   myOscMsg (address -> values) and empties it. the changed values are also 
+    #   kept as strings in monitored (collection index -> value), unless it is None
+    def diff(self, values, deadband, myOscMsg, monitored):
+        entries = self.entries
+        for slot, prop in enumerate(values):
+            if prop is None:
+                continue
+            values[slot] = None
+            entry = entries[slot]
+
+            # now make the values to be sent a tuple (unless its a string)
+            if isinstance(prop, (bool, int, float)):
+                prop = (prop,)
+
+            if entry.update(prop, deadband):
+                if monitored is not None:
+                    monitored[entry.index] = str(prop)
+
                 # sort the properties according to the osc_indices
-                if prop is not None and not isinstance(prop, str) and len(indices) > 0:
+                indices = entry.indices
+                if not isinstance(prop, str) and len(indices) > 0:
                     prop = tuple(prop[i] for i in indices)
-                myOscMsg[item.osc_address] = prop
-    return myOscMsg
+                myOscMsg[entry.address] = prop
+        return myOscMsg
+
+# the outputs sharing the same rate
+class OSCRateClass(object):
+    __slots__ = ('interval', 'due', 'entries', 'evaluations')
+
+    def __init__(self, interval, due, entries):
+        self.interval = interval            # second
+        self.due = due                      # monotonic time of the next evaluation
+        self.entries = entries
+        self.evaluations = 0                # since the last report
+
+# decides which outputs are due, by rate classes. the due times of a class 
+# follow a fixed grid of the monotonic clock, so the jitter of the modal timer
+# does not make the rates drift, and late evaluations skip the missed slots
+# instead of bursting. the modal timer runs at the fastest rate.
+class OSCOutputSchedule(object):
+
+    def __init__(self, entries, defaultRate):
+        rates = {}
+        for entry in entries:
+            rates.setdefault(entry.rate or defaultRate, []).append(entry)
+        now = time.monotonic()
+        self.classes = [OSCRateClass(rate / 1000, now, rateEntries) for rate, rateEntries in sorted(rates.items())]
+        # the fastest interval (second)
+        self.interval = self.classes[0].interval if self.classes else defaultRate / 1000
+        self.reported = now
+
+    # the entries due at now, in the order of the collection
+    def dueEntries(self, now):
+        # a class due within half a timer tick is evaluated now rather than a tick late
+        limit = now + self.interval / 2
+        entries = []
+        for rateClass in self.classes:
+            if rateClass.due <= limit:
+                entries += rateClass.entries
+                rateClass.evaluations += 1
+                rateClass.due += rateClass.interval
+                if rateClass.due <= now:
+                    rateClass.due += ((now - rateClass.due) // rateClass.interval + 1) * rateClass.interval
+        if len(self.classes) > 1:
+            entries.sort(key=lambda entry: entry.index)
+        return entries
+
+    # the achieved rate of each class since the last report
+    def report(self, now):
+        elapsed = now - self.reported
+        self.reported = now
+        rates = []
+        for rateClass in self.classes:
+            rates.append("{0}ms: {1:.1f}Hz".format(round(rateClass.interval * 1000), rateClass.evaluations / elapsed if elapsed > 0 else 0))
+            rateClass.evaluations = 0
+        return ", ".join(rates)
+
+# detects the changes, encodes and sends the output messages on its own 
+# thread. the buffers of the snapshot go round: the main thread fills one, 
+# one waits to be sent and the thread works through the third. if the thread
+# is still busy when the next buffer comes in, the waiting one is updated 
+# with its values instead, the newer values replacing the older ones. so the 
+# waiting values are bounded by the number of outputs.
+class OSCOutputSender(object):
+
+    def __init__(self, snapshot, transmit):
+        self.snapshot = snapshot
+        self.transmit = transmit            # transmit(oscMessage, bundleSize), called by the thread
+        self.error = None                   # the last exception raised by the thread
+        self.dropped = 0                    # number of values replaced before being sent
+        self._free = [snapshot.buffer(), snapshot.buffer()]
+        self._pending = None
+        self._settings = None               # (deadband, bundleSize, monitor) of the pending buffer
+        self._monitored = {}                # collection index -> sent value, for the message monitor
+        self._running = True
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="NodeOSC sender", daemon=True)
+        self._thread.start()
+
+    # called by the main thread: reads the entries (all of them if None) and 
+    #   hands their values over to the thread
+    def send(self, entries = None):
+        snapshot = self.snapshot
+        if snapshot.collect(entries):
+            envars = bpy.context.scene.nodeosc_envars
+            snapshot.values = self.submit(snapshot.values, envars.output_deadband, 
+                                          envars.output_bundle_size if envars.output_bundle else 0, envars.message_monitor)
+
+    # called by the main thread: returns the buffer to fill next
+    def submit(self, values, deadband, bundleSize, monitor):
+        with self._condition:
+            self._settings = (deadband, bundleSize, monitor)
+            pending = self._pending
+            if pending is None:
+                self._pending = values
+                self._condition.notify()
+                return self._free.pop()
+            for slot, value in enumerate(values):
+                if value is not None:
+                    if pending[slot] is not None:
+                        self.dropped += 1
+                    pending[slot] = value
+                    values[slot] = None
+            return values
+
+    # called by the main thread: writes the sent values to the handlers for the monitor
+    def writeMonitored(self, outputs):
+        if not self._monitored:
+            return
+        with self._condition:
+            monitored, self._monitored = self._monitored, {}
+        for index, value in monitored.items():
+            outputs[index].value = value
+
+    # called by the main thread: the messages not sent yet are dropped
+    def stop(self, timeout = 1):
+        with self._condition:
+            self._running = False
+            self._pending = None
+            self._condition.notify()
+        self._thread.join(timeout)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._running and self._pending is None:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                values, self._pending = self._pending, None
+                deadband, bundleSize, monitor = self._settings
+            try:
+                monitored = {} if monitor else None
+                oscMessage = self.snapshot.diff(values, deadband, {}, monitored)
+                if monitored:
+                    with self._condition:
+                        self._monitored.update(monitored)
+                if oscMessage:
+                    self.transmit(oscMessage, bundleSize)
+            except Exception as err:
+                self.error = err
+                # the buffer has to go back empty
+                values[:] = self.snapshot.buffer()
+            with self._condition:
+                self._free.append(values)
+
+# sends the outputs from the blender handlers instead of the modal timer: 
+# after a scene update only the outputs of the updated data-blocks are 
+# evaluated, after a frame change all of them.
+class OSCOutputTrigger(object):
+
+    def __init__(self, snapshot, sender):
+        self.snapshot = snapshot
+        self.sender = sender
+        self.error = None                   # the last exception raised while sending
+        self.executionTime = None           # the duration of the last send, reset by the reader
+        bpy.app.handlers.depsgraph_update_post.append(self.onDepsgraphUpdate)
+        bpy.app.handlers.frame_change_post.append(self.onFrameChange)
+
+    def remove(self):
+        for handlers, handler in ((bpy.app.handlers.depsgraph_update_post, self.onDepsgraphUpdate), 
+                                  (bpy.app.handlers.frame_change_post, self.onFrameChange)):
+            if handler in handlers:
+                handlers.remove(handler)
+
+    def onDepsgraphUpdate(self, scene, depsgraph = None):
+        if depsgraph is None:
+            self.send(None)
+        else:
+            self.send(self.snapshot.updatedEntries({update.id.original.as_pointer() for update in depsgraph.updates}))
+
+    def onFrameChange(self, scene, depsgraph = None):
+        self.send(None)
+
+    def send(self, entries):
+        # the handlers can not cancel the server, the errors are reported by the modal
+        if self.error is not None or entries == []:
+            return
+        try:
+            start = time.perf_counter()
+            self.sender.send(entries)
+            self.executionTime = time.perf_counter() - start
+        except Exception as err:
+            self.error = err
 
 #######################################
 #  PythonOSC Server  BASE CLASS       #
@@ -53,6 +415,11 @@ class OSC_OT_OSCServer(bpy.types.Operator):
 
     _timer = None
     count = 0
+    outputServer = None
+    outputSnapshot = None
+    outputSchedule = None
+    outputSender = None
+    outputTrigger = None
     
     #####################################
     # CUSTOMIZEABLE FUNCTIONS:
@@ -61,7 +428,9 @@ class OSC_OT_OSCServer(bpy.types.Operator):
     #outputServer = "" #for the sending socket
     #dispatcher = "" #dispatcher function
     
-    def sendingOSC(self, context, event):
+    # encode and send the messages (address -> values), called by the sender thread.
+    #   bundleSize is the maximal size of the bundles to send, 0 for no bundles
+    def transmitOSC(self, oscMessage, bundleSize):
          pass
         
     # setup the sending server
@@ -88,9 +457,19 @@ class OSC_OT_OSCServer(bpy.types.Operator):
     def shutDownInputServer(self, context, envars):
         pass
 
+    # stop sending
+    def shutDownOutputServer(self, context, envars):
+        pass
+
     #
     #
     #####################################
+
+    # read the values of the due outputs and hand them to the sender thread
+    def sendingOSC(self, context, event):
+        entries = self.outputSchedule.dueEntries(time.monotonic())
+        if entries:
+            self.outputSender.send(entries)
  
     #######################################
     #  MODAL Function                     #
@@ -107,7 +486,7 @@ class OSC_OT_OSCServer(bpy.types.Operator):
 
         if event.type == 'TIMER':
             #hack to refresh the GUI
-            self.count = self.count + envars.output_rate
+            self.count = self.count + self.outputSchedule.interval * 1000
             if envars.message_monitor == True:
                 if self.count >= 100:
                     self.count = 0
@@ -116,6 +495,30 @@ class OSC_OT_OSCServer(bpy.types.Operator):
             # only available spot where updating the sorcar tree doesn't throw errors...
             executeSorcarNodeTrees(context)
 
+            # report the errors of the sender thread and the output handlers
+            for source in (self.outputSender, self.outputTrigger):
+                if source is not None and source.error is not None:
+                    self.report({'WARNING'}, "Output error: {0}".format(source.error))
+                    return self.cancel(context)
+
+            # show the values sent by the thread
+            if envars.message_monitor:
+                self.outputSender.writeMonitored(bpy.context.scene.NodeOSC_outputs)
+
+            if self.outputTrigger is not None:
+                # the outputs are sent by the handlers. the execution time is only 
+                #   written when monitored, as it would trigger a scene update
+                if envars.message_monitor and self.outputTrigger.executionTime is not None:
+                    envars.executionTimeOutput = self.outputTrigger.executionTime
+                    self.outputTrigger.executionTime = None
+                return {'PASS_THROUGH'}
+
+            # the achieved output rates, once per second
+            if envars.message_monitor:
+                now = time.monotonic()
+                if now - self.outputSchedule.reported >= 1:
+                    envars.output_rates = self.outputSchedule.report(now)
+
             try:
                 start = time.perf_counter()
                 self.sendingOSC(context, event)
@@ -152,7 +555,7 @@ class OSC_OT_OSCServer(bpy.types.Operator):
                 
                 # register a message for executing 
                 if envars.node_update == "MESSAGE" and hasAnimationNodes():
-                    oscHandleList = (-1, None, None, None, None, 0, '', '')
+                    oscHandleList = (-1, None, None, None, None, 0, '', '', 'LATEST', 0)
                     self.addOscHandler(oscHandlerDict, envars.node_frameMessage, oscHandleList)
                 
                 for item in bpy.context.scene.NodeOSC_keys:
@@ -172,27 +575,27 @@ class OSC_OT_OSCServer(bpy.types.Operator):
                                     prop =  item.data_path[item.data_path.rindex('['):]
                                     prop = prop[2:-2] # get rid of [' ']
                                     datapath = item.data_path[0:item.data_path.rindex('[')]
-                                    oscHandleList = [1, eval(datapath), prop, item.idx, oscIndex, item.node_type, '', '']
+                                    oscHandleList = [1, eval(datapath), prop, item.idx, oscIndex, item.node_type, '', '', item.delivery, item.delivery_size]
                                 elif item.data_path[-1] == ']':
                                     #For normal properties with index in brackets 
                                     #   like bpy.data.objects['Cube'].location[0]
                                     datapath = item.data_path[0:item.data_path.rindex('.')]
                                     prop =  item.data_path[item.data_path.rindex('.') + 1:item.data_path.rindex('[')]
                                     prop_index =  item.data_path[item.data_path.rindex('[') + 1:item.data_path.rindex(']')]
-                                    oscHandleList = [3, eval(datapath), prop, int(prop_index), oscIndex, item.node_type, '', '']
+                                    oscHandleList = [3, eval(datapath), prop, int(prop_index), oscIndex, item.node_type, '', '', item.delivery, item.delivery_size]
                                 elif item.data_path[-1] == ')':
                                     # its a function call
-                                    oscHandleList = [7, item.data_path, '', item.idx, oscIndex, item.node_type, '', '']
+                                    oscHandleList = [7, item.data_path, '', item.idx, oscIndex, item.node_type, '', '', item.delivery, item.delivery_size]
                                 else:
                                     #without index in brackets
                                     datapath = item.data_path[0:item.data_path.rindex('.')]
                                     prop =  item.data_path[item.data_path.rindex('.') + 1:]
                                     if isinstance(getattr(eval(datapath), prop), (int, float, str)):
                                         # property is single value
-                                        oscHandleList = [2, eval(datapath), prop, item.idx, oscIndex, item.node_type, '', '']
+                                        oscHandleList = [2, eval(datapath), prop, item.idx, oscIndex, item.node_type, '', '', item.delivery, item.delivery_size]
                                     else:
                                         # property is array
-                                        oscHandleList = [4, eval(datapath), prop, item.idx, oscIndex, item.node_type, '', '']
+                                        oscHandleList = [4, eval(datapath), prop, item.idx, oscIndex, item.node_type, '', '', item.delivery, item.delivery_size]
                                         
                                 if oscHandleList != None:
                                     self.addOscHandler(oscHandlerDict, item.osc_address, oscHandleList)
@@ -208,9 +611,9 @@ class OSC_OT_OSCServer(bpy.types.Operator):
                                 oscHandleList = None
                                 
                                 if item.loop_enable:
-                                    oscHandleList = [10, item.data_path, '', 0, item.osc_index, item.node_type, item.dp_format, item.loop_range]
+                                    oscHandleList = [10, item.data_path, '', 0, item.osc_index, item.node_type, item.dp_format, item.loop_range, item.delivery, item.delivery_size]
                                 else:
-                                    oscHandleList = [10, item.data_path, '', 0, item.osc_index, item.node_type, item.dp_format, '']
+                                    oscHandleList = [10, item.data_path, '', 0, item.osc_index, item.node_type, item.dp_format, '', item.delivery, item.delivery_size]
                                 
                                 if oscHandleList != None:
                                     self.addOscHandler(oscHandlerDict, item.osc_address, oscHandleList)
@@ -222,6 +625,10 @@ class OSC_OT_OSCServer(bpy.types.Operator):
 
                 # lets go and find all nodes in all nodetrees that are relevant for us
                 nodes_createCollections()
+
+                # resolve the output handlers
+                self.outputSnapshot = OSCOutputSnapshot(bpy.context.scene.NodeOSC_outputs)
+                self.outputSchedule = OSCOutputSchedule(self.outputSnapshot.entries, envars.output_rate)
                 
                 for item in bpy.context.scene.NodeOSC_nodes:
                     if item.osc_direction != "OUTPUT":
@@ -233,14 +640,17 @@ class OSC_OT_OSCServer(bpy.types.Operator):
                             
                         try:
                             if item.node_data_type == "SINGLE":
-                                oscHandleList = [5, eval(item.data_path), item.props, item.idx, oscIndex, item.node_type, '', '']
+                                oscHandleList = [5, eval(item.data_path), item.props, item.idx, oscIndex, item.node_type, '', '', item.delivery, item.delivery_size]
                             elif item.node_data_type == "LIST":
-                                oscHandleList = [6, eval(item.data_path), item.props, item.idx, oscIndex, item.node_type, '', '']
+                                oscHandleList = [6, eval(item.data_path), item.props, item.idx, oscIndex, item.node_type, '', '', item.delivery, item.delivery_size]
 
                             self.addOscHandler(oscHandlerDict, item.osc_address, oscHandleList)
                         except Exception as err:
                             self.report({'WARNING'}, "Register node handle: object '"+item.data_path+"' with id '"+item.props+"' : {0}".format(err))
 
+                # compile the handler data packages into plans
+                oscHandlerDict = compileOscHandlers(oscHandlerDict)
+
                 # register all oscHandles on the server
                 for address, oscHandles in oscHandlerDict.items():
                     self.addMethod(address, oscHandles)
@@ -253,16 +663,23 @@ class OSC_OT_OSCServer(bpy.types.Operator):
 
                 # startup the receiving server
                 self.startupInputServer(context, envars)
+
+                # start sending only once nothing can fail anymore
+                self.outputSnapshot.watch()
+                self.outputSender = OSCOutputSender(self.outputSnapshot, self.transmitOSC)
+                if envars.output_trigger == 'DEPSGRAPH':
+                    self.outputTrigger = OSCOutputTrigger(self.outputSnapshot, self.outputSender)
                                 
                 # register the execute queue method
                 bpy.app.timers.register(execute_queued_OSC_callbacks)
 
                 #inititate the modal timer thread
                 context.window_manager.modal_handler_add(self)
-                self._timer = context.window_manager.event_timer_add(envars.output_rate/1000, window = context.window)
+                self._timer = context.window_manager.event_timer_add(self.outputSchedule.interval, window = context.window)
             
             except Exception as err:
                 self.report({'WARNING'}, "Server startup: {0}".format(err))
+                self.shutDownOutput(context, envars)
                 return {'CANCELLED'}
 
             envars.isServerRunning = True
@@ -280,6 +697,7 @@ class OSC_OT_OSCServer(bpy.types.Operator):
     def cancel(self, context):
         envars = bpy.context.scene.nodeosc_envars
         self.shutDownInputServer(context, envars)
+        self.shutDownOutput(context, envars)
         context.window_manager.event_timer_remove(self._timer)
 
         # hack to check who is calling the cancel method. 
@@ -293,6 +711,22 @@ class OSC_OT_OSCServer(bpy.types.Operator):
                   
         return {'CANCELLED'}
 
+    # remove the output handlers, stop the sender thread and close the output,
+    #   also after a failed startup
+    def shutDownOutput(self, context, envars):
+        if self.outputSnapshot is not None:
+            self.outputSnapshot.unwatch()
+        if self.outputTrigger is not None:
+            self.outputTrigger.remove()
+            self.outputTrigger = None
+        if self.outputSender is not None:
+            self.outputSender.stop()
+            self.outputSender = None
+        # the backends declare an empty outputServer until it is set up
+        if self.outputServer:
+            self.shutDownOutputServer(context, envars)
+            self.outputServer = None
+
     # will take an address and a oscHandle data packet. 
     # if the address has already been used, the package will be added to the packagelist
     def addOscHandler(self, handleDict, address, oscHandlePackage):
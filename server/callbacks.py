@@ -1,24 +1,161 @@
 import bpy
-import queue
+import threading
 import time
+import functools
+from array import array
+from collections import OrderedDict
 from ..nodes.nodes import *
 from ..utils import utils
 
+# numpy is used to gather the values of looped handlers, if available
+try:
+    import numpy
+    has_numpy = True
+except ModuleNotFoundError:
+    has_numpy = False
+
+# the servers can hand over the arguments of long float or int only messages 
+# as a single array (see the input_array_threshold setting)
+OSC_ARRAY_TYPES = (array, numpy.ndarray) if has_numpy else (array,)
+
+# the single values taken from numpy arrays are numpy scalars, which id 
+# properties and nodes don't accept: they are converted to python scalars
+def oscScalar(value):
+    if has_numpy and isinstance(value, numpy.generic):
+        return value.item()
+    return value
+
 #######################################
 #  OSC Receive Method                 #
 #######################################
 
 # the OSC-server should not directly modify blender data from its own thread.
-# instead we need a queue to store the callbacks and execute them inside
+# instead we need a mailbox to store the callbacks and execute them inside
 # a blender timer thread
 
-# define the queue to store the callbacks
-OSC_callback_queue = queue.LifoQueue()
+# a preallocated ring buffer that keeps the messages of a handler with ordered
+# delivery. it holds two buffers: the receiving thread fills one while the
+# timer thread works through the other one, they are exchanged in constant time.
+class OSCRingBuffer(object):
+    __slots__ = ('_items', '_spare', '_head', '_count', '_drained', 'bounded', 'dropped')
+
+    def __init__(self, size, bounded):
+        self._items = [None] * size
+        self._spare = [None] * size
+        self._head = 0
+        self._count = 0
+        self._drained = (self._spare, 0, 0)
+        self.bounded = bounded      # if True, the oldest message is dropped when full
+        self.dropped = 0            # number of dropped messages
+
+    def __len__(self):
+        return self._count
+
+    # called by the receiving thread (inside the mailbox lock)
+    def append(self, value):
+        items = self._items
+        size = len(items)
+        if self._count == size:
+            if self.bounded:
+                # overwrite the oldest message
+                items[self._head] = value
+                self._head = (self._head + 1) % size
+                self.dropped += 1
+                return
+            # no message may be dropped: unroll into a buffer twice the size
+            items = self._items = items[self._head:] + items[:self._head] + [None] * size
+            self._head = 0
+            size = len(items)
+        items[(self._head + self._count) % size] = value
+        self._count += 1
+
+    # called by the timer thread (inside the mailbox lock)
+    def swap(self):
+        self._drained = (self._items, self._head, self._count)
+        self._items, self._spare = self._spare, self._items
+        self._head = 0
+        self._count = 0
+
+    # called by the timer thread: iterates the messages taken by the last swap
+    def drained(self):
+        items, head, count = self._drained
+        size = len(items)
+        for i in range(head, head + count):
+            yield items[i % size]
+
+# the mailbox coalesces the incoming messages: for each handler with 'latest'
+# delivery only the last osc message received will be kept. all older messages 
+# are replaced, so its size is bounded by the number of handlers, not the 
+# message rate. handlers with ordered delivery store their messages in their
+# own ring buffer instead.
+class OSCMailbox(object):
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latest = {}
+        self.arrived = False    # set by the receiving thread, reset by drain
+
+    # called by the receiving thread
+    def put(self, key, func, args):
+        with self._lock:
+            self._latest[key] = (func, args)
+            self.arrived = True
 
-# the repeatfilter, together with lifo (last in - first out) will
-# make sure only the last osc message received on a certain address
-# will be applied. all older messages will be ignored.
-queue_repeat_filter = {}
+    # called by the receiving thread for handlers with ordered delivery
+    def push(self, key, func, ring, args):
+        with self._lock:
+            ring.append(args)
+            self._latest[key] = (func, ring)
+            self.arrived = True
+
+    # called by the timer thread: takes all pending callbacks with one swap
+    def drain(self):
+        # nothing arrived since the last drain: no need to take the lock
+        if not self.arrived:
+            return {}
+        with self._lock:
+            latest, self._latest = self._latest, {}
+            self.arrived = False
+            for func, args in latest.values():
+                if args.__class__ is OSCRingBuffer:
+                    args.swap()
+        return latest
+
+    def clear(self):
+        with self._lock:
+            self._latest = {}
+            self.arrived = False
+
+# define the mailbox to store the callbacks
+OSC_callback_mailbox = OSCMailbox()
+
+# chooses the interval of the timer executing the callbacks: as soon as
+# messages arrive it is tightened to the input rate, then doubled at each
+# call without messages up to the latency ceiling. the cpu ceiling lengthens
+# it so that executing the callbacks takes at most this share of the time.
+# with the default settings (no latency ceiling, 100%) the interval stays at
+# the input rate.
+class OSCInputInterval(object):
+    MIN_BACKOFF = 0.001     # first step when backing off from 0 (seconds)
+
+    def __init__(self):
+        self.interval = 0.0
+
+    # all the times in seconds, cpu_max in percent
+    def next(self, busy, elapsed, rate, latency_max, cpu_max):
+        if busy:
+            interval = rate
+        else:
+            interval = min(max(self.interval * 2, rate, self.MIN_BACKOFF), max(latency_max, rate))
+        if cpu_max < 100:
+            interval = max(interval, elapsed * (100 - cpu_max) / cpu_max)
+        self.interval = interval
+        return interval
+
+    def reset(self):
+        self.interval = 0.0
+
+OSC_input_interval = OSCInputInterval()
 
 # contains all the OSC messages that are expected to be received
 OSC_Callback_Handlers = {}
@@ -27,29 +164,29 @@ OSC_Callback_Handlers = {}
 def setOscHandlers(_oscHandlers):
     global OSC_Callback_Handlers
     OSC_Callback_Handlers = _oscHandlers
+    # callbacks left over from a previous server run are stale
+    OSC_callback_mailbox.clear()
+    OSC_input_interval.reset()
+    # the data-paths might point to different data now
+    OSC_accessor_cache.clear()
+    OSC_bulk_cache.clear()
 
 # define the method the timer thread is calling when it is appropriate
 def execute_queued_OSC_callbacks():
     start = time.perf_counter()
-    queue_repeat_filter.clear()
-    
-    hasOscMessages = False
-    
-    # while there are callbacks stored inside the queue
-    while not OSC_callback_queue.empty():
-        hasOscMessages = True
-        items = OSC_callback_queue.get()
-        address_uniq = items[1]
-        # if the address has not been here before:
-        if queue_repeat_filter.get(address_uniq, False) == False:
-            func = items[0]
-            args = items[2:]
-            # execute them 
-            func(*args)
-            
-        queue_repeat_filter[address_uniq] = True
+
+    # take all the callbacks stored inside the mailbox
+    callbacks = OSC_callback_mailbox.drain()
+
+    # and execute them 
+    for func, args in callbacks.values():
+        if args.__class__ is OSCRingBuffer:
+            for ringArgs in args.drained():
+                func(ringArgs)
+        else:
+            func(args)
         
-    if hasOscMessages:
+    if callbacks:
         if bpy.context.scene.nodeosc_envars.node_update != "MESSAGE":
             bpy.context.scene.nodeosc_AN_needsUpdate = True
             bpy.context.scene.nodeosc_SORCAR_needsUpdate = True
@@ -60,9 +197,18 @@ def execute_queued_OSC_callbacks():
     
     # calculate the execution time
     end = time.perf_counter()
-    bpy.context.scene.nodeosc_envars.executionTimeInput = end - start
+    envars = bpy.context.scene.nodeosc_envars
+    # a scene property write triggers a scene update, which the output sends on
+    #   with the 'on scene update' trigger: only write it then if it is monitored
+    if envars.message_monitor or envars.output_trigger != 'DEPSGRAPH':
+        envars.executionTimeInput = end - start
     
-    return 0 if bpy.context.scene.nodeosc_envars.input_rate == 0 else bpy.context.scene.nodeosc_envars.input_rate / 1000
+    # and when to be called again
+    interval = OSC_input_interval.next(len(callbacks) > 0, end - start, envars.input_rate / 1000, 
+                                       envars.input_latency_max / 1000, envars.input_cpu_max)
+    if envars.message_monitor and abs(envars.input_interval - interval * 1000) > 0.001:
+        envars.input_interval = interval * 1000
+    return interval
 
 # called by the queue execution thread
 def OSC_callback_unkown(address, args):
@@ -70,28 +216,30 @@ def OSC_callback_unkown(address, args):
     bpy.context.scene.nodeosc_envars.lastpayload = str(args)
 
 # called by the queue execution thread
+#   data_path is either the source string or its compiled code object
 def OSC_callback_function(address, data_path, prop, attrIdx, oscArgs, oscIndex):
     try:
         eval(data_path)
     except:
         if bpy.context.scene.nodeosc_envars.message_monitor == True:
-            bpy.context.scene.nodeosc_envars.error =  "function call failed: "+address + " " + data_path
+            bpy.context.scene.nodeosc_envars.error =  "function call failed: "+address + " " + expressionSource(data_path)
 
 # called by the queue execution thread
+#   data_path is either the source string or its compiled code object
 def OSC_callback_statement(address, data_path, prop, attrIdx, oscArgs, oscIndex):
     try:
         exec(data_path)
     except:
         if bpy.context.scene.nodeosc_envars.message_monitor == True:
-            bpy.context.scene.nodeosc_envars.error =  "statement call failed: "+address + " " + data_path
+            bpy.context.scene.nodeosc_envars.error =  "statement call failed: "+address + " " + expressionSource(data_path)
 
 # called by the queue execution thread
 def OSC_callback_custom(address, data_path, prop, attrIdx, oscArgs, oscIndex):
     try:
         if len(oscIndex) > 0:
-            data_path[prop] = oscArgs[oscIndex[0]]
+            data_path[prop] = oscScalar(oscArgs[oscIndex[0]])
         else:
-            data_path[prop] = oscArgs[0]
+            data_path[prop] = oscScalar(oscArgs[0])
     except TypeError as err:
         if bpy.context.scene.nodeosc_envars.message_monitor == True:
             bpy.context.scene.nodeosc_envars.error =  "Message attribute invalid: "+address + " " + str(oscArgs) + " " + str(err)      
@@ -105,6 +253,7 @@ def OSC_callback_Property(address, data_path, prop, attrIdx, oscArgs, oscIndex):
         val = oscArgs[0]
         if len(oscIndex) > 0:
             val = oscArgs[oscIndex[0]]
+        val = oscScalar(val)
         setattr(data_path,prop,val)
     except TypeError as err:
         if bpy.context.scene.nodeosc_envars.message_monitor == True:
@@ -117,9 +266,9 @@ def OSC_callback_Property(address, data_path, prop, attrIdx, oscArgs, oscIndex):
 def OSC_callback_IndexedProperty(address, data_path, prop, attrIdx, oscArgs, oscIndex):
     try:
         if len(oscIndex) > 0:
-            getattr(data_path,prop)[attrIdx] = oscArgs[oscIndex[0]]
+            getattr(data_path,prop)[attrIdx] = oscScalar(oscArgs[oscIndex[0]])
         else:
-            getattr(data_path,prop)[attrIdx] = oscArgs[0]
+            getattr(data_path,prop)[attrIdx] = oscScalar(oscArgs[0])
     except TypeError as err:
         if bpy.context.scene.nodeosc_envars.message_monitor == True:
             bpy.context.scene.nodeosc_envars.error =  "Message attribute invalid: "+address + " " + str(oscArgs) + " " + str(err)      
@@ -131,6 +280,8 @@ def OSC_callback_IndexedProperty(address, data_path, prop, attrIdx, oscArgs, osc
 def OSC_callback_properties(address, data_path, prop, attrIdx, oscArgs, oscIndex):
     try:
         if len(oscIndex) > 0:
+            if isinstance(oscArgs, OSC_ARRAY_TYPES):
+                oscArgs = oscArgs.tolist()
             getattr(data_path, prop)[:] = (oscArgs[i] for i in oscIndex)
         else:
             getattr(data_path, prop)[:] = oscArgs
@@ -148,6 +299,7 @@ def OSC_callback_nodeFLOAT(address, data_path, prop, attrIdx, oscArgs, oscIndex)
         val = oscArgs[0]
         if len(oscIndex) > 0:
             val = oscArgs[oscIndex[0]]
+        val = oscScalar(val)
         getattr(data_path, prop)(val)
     except TypeError as err:
         if bpy.context.scene.nodeosc_envars.message_monitor == True:
@@ -159,6 +311,8 @@ def OSC_callback_nodeFLOAT(address, data_path, prop, attrIdx, oscArgs, oscIndex)
 # called by the queue execution thread
 def OSC_callback_nodeLIST(address, data_path, prop, attrIdx, oscArgs, oscIndex):
     try:
+        if isinstance(oscArgs, OSC_ARRAY_TYPES):
+            oscArgs = oscArgs.tolist()
         val = list(oscArgs)
         if len(oscIndex) > 0:
             val = list(oscArgs[i] for i in oscIndex)
@@ -170,15 +324,262 @@ def OSC_callback_nodeLIST(address, data_path, prop, attrIdx, oscArgs, oscIndex):
         if bpy.context.scene.nodeosc_envars.message_monitor == True:
             bpy.context.scene.nodeosc_envars.error =  "Improper attributes received: "+address + " " + str(oscArgs)
 
+#######################################
+#  Compiled Accessors                 #
+#######################################
+
+# a least recently used cache. it is only accessed by the timer thread
+class OSCAccessorCache(object):
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+
+    # returns the cached value for key. if there is none, it is created by factory(key)
+    def get(self, key, factory):
+        cache = self._cache
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = factory(key)
+        cache[key] = value
+        if len(cache) > self.maxsize:
+            cache.popitem(last = False)
+        return value
+
+    def put(self, key, value):
+        cache = self._cache
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > self.maxsize:
+            cache.popitem(last = False)
+
+    def remove(self, key):
+        self._cache.pop(key, None)
+
+    def clear(self):
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+# compiled code objects of format, index, range and function expressions
+OSC_expression_cache = OSCAccessorCache(1024)
+
+# data-path accessors, keyed by the formatted data-path
+OSC_accessor_cache = OSCAccessorCache(4096)
+
+# the source is used as filename of the code object, so it can be recovered
+#   for error messages (see expressionSource)
+def compileExpressionKey(key):
+    source, mode = key
+    return compile(source, source, mode)
+
+# returns the code object of an expression. 
+#   evaluating it has the same effect as evaluating the source string
+def compiledExpression(source, mode = 'eval'):
+    return OSC_expression_cache.get((source, mode), compileExpressionKey)
+
+# returns the source string of an expression
+def expressionSource(expression):
+    if isinstance(expression, str):
+        return expression
+    return expression.co_filename
+
+# analyses a formatted data-path to figure out how the values have to be applied.
+# returns a tuple with
+#   the callback, 
+#   the code object that evaluates the owner of the property (or the function call / statement),
+#   if the owner needs to be evaluated before calling the callback,
+#   the property name,
+#   the property index (None if the attribute index of the handler applies)
+def compileDataPath(f_data_path):
+    if f_data_path.find('][') != -1 and (f_data_path[-2:] == '"]' or f_data_path[-2:] == '\']'):
+        #For custom properties 
+        #   like bpy.data.objects['Cube']['customProp']
+        prop = f_data_path[f_data_path.rindex('['):]
+        prop = prop[2:-2] # get rid of [' ']
+        datapath = f_data_path[0:f_data_path.rindex('[')]
+        return (OSC_callback_custom, compiledExpression(datapath), True, prop, None)
+    elif f_data_path[-1] == ']':
+        #For normal properties with index in brackets 
+        #   like bpy.data.objects['Cube'].location[0]
+        datapath = f_data_path[0:f_data_path.rindex('.')]
+        prop =  f_data_path[f_data_path.rindex('.') + 1:f_data_path.rindex('[')]
+        prop_index =  f_data_path[f_data_path.rindex('[') + 1:f_data_path.rindex(']')]
+        return (OSC_callback_IndexedProperty, compiledExpression(datapath), True, prop, int(prop_index))
+    elif f_data_path[-1] == ')' :
+        # its a function call 
+        return (OSC_callback_function, compiledExpression(f_data_path), False, '', None)
+    elif f_data_path.find('=') != -1:
+        # its a statement call 
+        return (OSC_callback_statement, compiledExpression(f_data_path, 'exec'), False, '', None)
+    else:
+        #without index in brackets
+        datapath = f_data_path[0:f_data_path.rindex('.')]
+        prop =  f_data_path[f_data_path.rindex('.') + 1:]
+        return (OSC_callback_properties, compiledExpression(datapath), True, prop, None)
+
+#######################################
+#  Bulk Apply for Looped Handlers     #
+#######################################
+
+# a looped format handler that writes the same property across a collection
+# of targets. the targets and argument indices are resolved once, so a 
+# message only costs one gather of the values and one assignment per target.
+class OSCBulkPlan(object):
+    __slots__ = ('owners', 'names', 'prop', 'propIndices', 'indices', 'indexArray', 'written')
+
+    def __init__(self, owners, prop, propIndices, indices):
+        self.owners = owners            # the resolved owners of the property
+        self.names = [getattr(owner, 'name', None) for owner in owners]
+        self.written = 0                # the number of owners written by the last apply
+        self.prop = prop                # the property name
+        self.propIndices = propIndices  # the property index per owner, None if the whole property is set
+        self.indices = indices          # the osc argument indices per owner
+        self.indexArray = None
+        # with numpy all values are gathered with a single fancy indexing operation
+        if has_numpy and len(indices) > 0:
+            width = len(indices[0])
+            if width > 0 and all(len(idx) == width for idx in indices):
+                if propIndices is None:
+                    self.indexArray = numpy.array(indices, dtype = numpy.intp)
+                elif width == 1:
+                    self.indexArray = numpy.array([idx[0] for idx in indices], dtype = numpy.intp)
+
+    # returns the values for each owner
+    def gather(self, oscArgs):
+        if self.indexArray is not None:
+            if isinstance(oscArgs, numpy.ndarray):
+                return oscArgs[self.indexArray].tolist()
+            # numpy would convert mixed arguments to a common type (ints to floats, 
+            #   numbers to strings), so only arguments of one numeric type are gathered with it
+            argTypes = set(map(type, oscArgs))
+            if len(argTypes) == 1 and argTypes <= OSC_numpy_gather_types:
+                return numpy.asarray(oscArgs)[self.indexArray].tolist()
+        if isinstance(oscArgs, OSC_ARRAY_TYPES):
+            oscArgs = oscArgs.tolist()
+        if self.propIndices is None:
+            return [[oscArgs[i] for i in idx] if len(idx) > 0 else oscArgs for idx in self.indices]
+        return [oscArgs[idx[0]] if len(idx) > 0 else oscArgs[0] for idx in self.indices]
+
+    # the owners resolved by the plan might have been renamed or removed 
+    #   (or invalidated by an undo) since
+    def valid(self):
+        try:
+            for owner, name in zip(self.owners, self.names):
+                if name is None:
+                    owner.id_data
+                elif owner.name != name:
+                    return False
+        except ReferenceError:
+            return False
+        return True
+
+    def apply(self, oscArgs):
+        prop = self.prop
+        self.written = 0
+        values = self.gather(oscArgs)
+        if self.propIndices is None:
+            for owner, value in zip(self.owners, values):
+                getattr(owner, prop)[:] = value
+                self.written += 1
+        else:
+            for owner, propIndex, value in zip(self.owners, self.propIndices, values):
+                getattr(owner, prop)[propIndex] = value
+                self.written += 1
+
+# the argument types that numpy gathers without changing them
+OSC_numpy_gather_types = {float, int, bool}
+
+# bulk plans of looped handlers, keyed by the handler and the number of arguments.
+#   False marks a handler that cannot be applied in bulk
+OSC_bulk_cache = OSCAccessorCache(256)
+
+# creates the bulk plan for a looped format handler. 
+#   returns False if the handler is not suited
+def compileBulkPlan(key):
+    try:
+        return createBulkPlan(*key)
+    except Exception:
+        # the loop will report the error
+        return False
+
+def createBulkPlan(data_path, oscIndex, sFormat, sRange, length):
+    # the targets may not depend on the values of the arguments
+    for expression in (sFormat, oscIndex, sRange):
+        names = compiledExpression(expression).co_names
+        if 'args' in names or 'oscArgs' in names:
+            return False
+
+    owners = []
+    indices = []
+    propIndices = []
+    bulkProp = None
+    bulkCallback = None
+    for index in range(*eval(compiledExpression(sRange))):
+        myFormat = eval(compiledExpression(sFormat))
+        if type(myFormat) is tuple:     
+            f_data_path = data_path.format(*myFormat)
+        else:
+            f_data_path = data_path.format(myFormat)
+        f_OscIndex = eval(compiledExpression(oscIndex))
+        if isinstance(f_OscIndex, int): 
+            f_OscIndex = (f_OscIndex,)
+
+        callback, code, evalOwner, prop, prop_index = OSC_accessor_cache.get(f_data_path, compileDataPath)
+        # all the targets have to write the same property
+        if callback not in (OSC_callback_properties, OSC_callback_IndexedProperty):
+            return False
+        if bulkCallback is None:
+            bulkCallback = callback
+            bulkProp = prop
+        elif callback is not bulkCallback or prop != bulkProp:
+            return False
+
+        owners.append(eval(code))
+        indices.append(tuple(f_OscIndex))
+        propIndices.append(prop_index)
+
+    if bulkCallback is None:
+        return False
+
+    return OSCBulkPlan(owners, bulkProp, propIndices if bulkCallback is OSC_callback_IndexedProperty else None, indices)
+
 # called by the queue execution thread
 def OSC_callback_format(address, data_path, prop_ignore, attrIdx, oscArgs, oscIndex, sFormat, sRange):
     # prepare the available variables
     length = len(oscArgs)
     args = oscArgs
+    start = 0
     if sRange == '':
         call_format(address, data_path, prop_ignore, attrIdx, oscArgs, oscIndex, sFormat, 0)
     else:
-        for index in range (*eval(sRange)):
+        # try to apply the loop in bulk, unless the evaluated data-paths are monitored
+        if bpy.context.scene.nodeosc_envars.debug_monitor == False:
+            key = (data_path, oscIndex, sFormat, sRange, length)
+            plan = OSC_bulk_cache.get(key, compileBulkPlan)
+            if plan:
+                if not plan.valid():
+                    # the targets changed: resolve them again next time, the loop 
+                    #   below evaluates the data-paths as they are now
+                    OSC_bulk_cache.remove(key)
+                else:
+                    try:
+                        plan.apply(oscArgs)
+                        return
+                    except Exception:
+                        # the values don't suit the targets: don't try in bulk again until 
+                        #   the handlers are reset. the loop below goes on after the owners
+                        #   already written, and reports the error
+                        OSC_bulk_cache.put(key, False)
+                        start = plan.written
+
+        for index in range (*eval(compiledExpression(sRange)))[start:]:
             call_format(address, data_path, prop_ignore, attrIdx, oscArgs, oscIndex, sFormat, index)
 
 # called by the queue execution thread
@@ -187,13 +588,13 @@ def call_format(address, data_path, prop_ignore, attrIdx, oscArgs, oscIndex, sFo
         # format the data_path
         length = len(oscArgs)
         args = oscArgs
-        myFormat = eval(sFormat)
+        myFormat = eval(compiledExpression(sFormat))
         if type(myFormat) is tuple:     
             f_data_path = data_path.format(*myFormat)
         else:
             f_data_path = data_path.format(myFormat)
                 
-        f_OscIndex = eval(oscIndex)
+        f_OscIndex = eval(compiledExpression(oscIndex))
 
         if bpy.context.scene.nodeosc_envars.debug_monitor == True:
             msg = "Recived: "+address + " " + str(oscArgs)  + " -> applied to evaluated data-path: '" + f_data_path + "' with format: '" + str(myFormat) + "' and args[idx]: '" + str(f_OscIndex) + "' "
@@ -202,34 +603,15 @@ def call_format(address, data_path, prop_ignore, attrIdx, oscArgs, oscIndex, sFo
         #  ... and don't forget the corner case
         if isinstance(f_OscIndex, int): 
             f_OscIndex = (f_OscIndex,)
-        # now we have to analyse the data_path to figure out how we have to apply the values
-        if f_data_path.find('][') != -1 and (f_data_path[-2:] == '"]' or f_data_path[-2:] == '\']'):
-            #For custom properties 
-            #   like bpy.data.objects['Cube']['customProp']
-            prop = f_data_path[f_data_path.rindex('['):]
-            prop = prop[2:-2] # get rid of [' ']
-            datapath = f_data_path[0:f_data_path.rindex('[')]
-            OSC_callback_custom(address, eval(datapath), prop, attrIdx, oscArgs, f_OscIndex)
-        elif f_data_path[-1] == ']':
-            #For normal properties with index in brackets 
-            #   like bpy.data.objects['Cube'].location[0]
-            datapath = f_data_path[0:f_data_path.rindex('.')]
-            prop =  f_data_path[f_data_path.rindex('.') + 1:f_data_path.rindex('[')]
-            prop_index =  f_data_path[f_data_path.rindex('[') + 1:f_data_path.rindex(']')]
-            OSC_callback_IndexedProperty(address, eval(datapath), prop, int(prop_index), oscArgs, f_OscIndex)
-        elif f_data_path[-1] == ')' :
-            # its a function call 
-            prop = ''
-            OSC_callback_function(address, f_data_path, prop, attrIdx, oscArgs, f_OscIndex)
-        elif f_data_path.find('=') != -1:
-            # its a statement call 
-            prop = ''
-            OSC_callback_statement(address, f_data_path, prop, attrIdx, oscArgs, f_OscIndex)
+
+        # now we get the accessor to figure out how we have to apply the values
+        callback, code, evalOwner, prop, prop_index = OSC_accessor_cache.get(f_data_path, compileDataPath)
+        if prop_index is None:
+            prop_index = attrIdx
+        if evalOwner:
+            callback(address, eval(code), prop, prop_index, oscArgs, f_OscIndex)
         else:
-            #without index in brackets
-            datapath = f_data_path[0:f_data_path.rindex('.')]
-            prop =  f_data_path[f_data_path.rindex('.') + 1:]
-            OSC_callback_properties(address, eval(datapath), prop, attrIdx, oscArgs, f_OscIndex)
+            callback(address, code, prop, prop_index, oscArgs, f_OscIndex)
  
     except TypeError as err:
         if bpy.context.scene.nodeosc_envars.message_monitor == True:
@@ -245,7 +627,7 @@ def call_format(address, data_path, prop_ignore, attrIdx, oscArgs, oscIndex, sFo
 def OSC_callback_pythonosc_undef(* args):
     if bpy.context.scene.nodeosc_envars.message_monitor == True:
         address = args[0]
-        OSC_callback_queue.put((OSC_callback_unkown, address, address, args[1:]))
+        OSC_callback_mailbox.put(address, functools.partial(OSC_callback_unkown, address), args[1:])
 
 # method called by the oscpy library in case of a mapped message
 def OSC_callback_oscpy(* args):
@@ -255,6 +637,8 @@ def OSC_callback_oscpy(* args):
     
     address = bytes.decode(args[0])
     oscArgs = args[1:]
+    if len(oscArgs) == 1 and isinstance(oscArgs[0], OSC_ARRAY_TYPES):
+        oscArgs = oscArgs[0]
     global OSC_Callback_Handlers
     data = OSC_Callback_Handlers.get(address)
     
@@ -262,7 +646,7 @@ def OSC_callback_oscpy(* args):
         fillCallbackQue(address, oscArgs, data)
     else:
         if bpy.context.scene.nodeosc_envars.message_monitor:
-            OSC_callback_queue.put((OSC_callback_unkown, address, address, oscArgs))
+            OSC_callback_mailbox.put(address, functools.partial(OSC_callback_unkown, address), oscArgs)
         
 
 # method called by the pythonosc library in case of a mapped message
@@ -274,6 +658,8 @@ def OSC_callback_pythonosc(* args):
     address = args[0]
     data = args[1][0]
     oscArgs = args[2:]
+    if len(oscArgs) == 1 and isinstance(oscArgs[0], OSC_ARRAY_TYPES):
+        oscArgs = oscArgs[0]
     
     fillCallbackQue(address, oscArgs, data)
      
@@ -286,43 +672,97 @@ def OSC_callback_pyliblo(path, args, types, src, data):
     fillCallbackQue(address, oscArgs, data)
 
 
-def fillCallbackQue(address, oscArgs, dataList):
-    index = 0
-    for data in dataList:
-        mytype = data[0]        # callback type 
-        datapath = data[1]      # blender datapath (i.e. bpy.data.objects['Cube'])
-        prop = data[2]          # blender property (i.e. location)
-        attrIdx = data[3]       # blender property index (i.e. location[index])
-        oscIndex = data[4]      # osc argument index to use (should be a tuplet, like (1,2,3))
-        nodeType = data[5]      # node type 
-        myFormat = data[6]      # datapath format string
-        myRange = data[7]       # loop range string
+# the compiled form of a registered handler. a plan is created once per handler
+# when the server starts, so an incoming message only costs a dict lookup and a
+# mailbox entry per handler instead of unpacking and dispatching the raw handler data.
+class OSCHandlerPlan(object):
+    __slots__ = ('apply', 'key', 'oscIndex', 'immediate', 'ring')
 
-        address_uniq = address + "_" + str(index)
-        
-        if mytype == -1:
-            #special type reserved for message that triggers the execution of nodetrees
-            if nodeType == 1:
-                bpy.context.scene.nodeosc_AN_needsUpdate = True
-            elif nodeType == 2:
-                bpy.context.scene.nodeosc_SORCAR_needsUpdate = True
-        elif mytype == 0:
-            OSC_callback_queue.put((OSC_callback_unkown, address_uniq, address, oscArgs))
-        elif mytype == 1:
-            OSC_callback_queue.put((OSC_callback_custom, address_uniq, address, datapath, prop, attrIdx, oscArgs, oscIndex))
-        elif mytype == 2:
-            OSC_callback_queue.put((OSC_callback_Property, address_uniq, address, datapath, prop, attrIdx, oscArgs, oscIndex))
-        elif mytype == 3:
-            OSC_callback_queue.put((OSC_callback_IndexedProperty, address_uniq, address, datapath, prop, attrIdx, oscArgs, oscIndex))
-        elif mytype == 4:
-            OSC_callback_queue.put((OSC_callback_properties, address_uniq, address, datapath, prop, attrIdx, oscArgs, oscIndex))
-        elif mytype == 5:
-            OSC_callback_queue.put((OSC_callback_nodeFLOAT, address_uniq, address, datapath, prop, attrIdx, oscArgs, oscIndex))
-        elif mytype == 6:
-            OSC_callback_queue.put((OSC_callback_nodeLIST, address_uniq, address, datapath, prop, attrIdx, oscArgs, oscIndex))
-        elif mytype == 7:
-            OSC_callback_queue.put((OSC_callback_function, address_uniq, address, datapath, prop, attrIdx, oscArgs, oscIndex))
-        elif mytype == 10:
-            OSC_callback_queue.put((OSC_callback_format, address_uniq, address, datapath, prop, attrIdx, oscArgs, oscIndex, myFormat, myRange))
-
-        index += 1
\ No newline at end of file
+    def __init__(self, apply, key, oscIndex, immediate = False, ring = None):
+        object.__setattr__(self, 'apply', apply)            # pre-bound callback, only expects the osc arguments
+        object.__setattr__(self, 'key', key)                # unique key of this handler (address + "_" + index)
+        object.__setattr__(self, 'oscIndex', oscIndex)      # pre-resolved osc argument indices
+        object.__setattr__(self, 'immediate', immediate)    # executed on the receiving thread instead of queued
+        object.__setattr__(self, 'ring', ring)              # ring buffer for ordered delivery, None for latest only
+
+    def __setattr__(self, name, value):
+        raise AttributeError("OSCHandlerPlan is immutable")
+
+    def __repr__(self):
+        return "OSCHandlerPlan(" + self.key + ")"
+
+# called by the receiving thread for the message that triggers the execution of nodetrees
+def OSC_callback_nodeTrigger(nodeType, oscArgs):
+    if nodeType == 1:
+        bpy.context.scene.nodeosc_AN_needsUpdate = True
+    elif nodeType == 2:
+        bpy.context.scene.nodeosc_SORCAR_needsUpdate = True
+
+# the callback functions for each handler type
+OSC_callback_types = {
+    1: OSC_callback_custom,
+    2: OSC_callback_Property,
+    3: OSC_callback_IndexedProperty,
+    4: OSC_callback_properties,
+    5: OSC_callback_nodeFLOAT,
+    6: OSC_callback_nodeLIST,
+    7: OSC_callback_function,
+}
+
+# compiles the handler data package created by the server into a plan
+def compileOscHandler(address, index, data):
+    mytype = data[0]        # callback type 
+    datapath = data[1]      # blender datapath (i.e. bpy.data.objects['Cube'])
+    prop = data[2]          # blender property (i.e. location)
+    attrIdx = data[3]       # blender property index (i.e. location[index])
+    oscIndex = data[4]      # osc argument index to use (should be a tuplet, like (1,2,3))
+    nodeType = data[5]      # node type 
+    myFormat = data[6]      # datapath format string
+    myRange = data[7]       # loop range string
+    delivery = data[8]      # delivery policy (LATEST, FIFO or FIFO_BOUNDED)
+    deliverySize = data[9]  # ring buffer size for ordered delivery
+
+    address_uniq = address + "_" + str(index)
+
+    if mytype == -1:
+        #special type reserved for message that triggers the execution of nodetrees
+        return OSCHandlerPlan(functools.partial(OSC_callback_nodeTrigger, nodeType), address_uniq, oscIndex, True)
+    elif mytype == 0:
+        apply = functools.partial(OSC_callback_unkown, address)
+    elif mytype == 7:
+        # compile the function call once. a syntax error will be reported when it is called
+        try:
+            datapath = compiledExpression(datapath)
+        except SyntaxError:
+            pass
+        apply = functools.partial(OSC_callback_function, address, datapath, prop, attrIdx, oscIndex = oscIndex)
+    elif mytype == 10:
+        apply = functools.partial(OSC_callback_format, address, datapath, prop, attrIdx, oscIndex = oscIndex, sFormat = myFormat, sRange = myRange)
+    else:
+        apply = functools.partial(OSC_callback_types[mytype], address, datapath, prop, attrIdx, oscIndex = oscIndex)
+
+    ring = None
+    if delivery == "FIFO":
+        ring = OSCRingBuffer(max(deliverySize, 1), False)
+    elif delivery == "FIFO_BOUNDED":
+        ring = OSCRingBuffer(max(deliverySize, 1), True)
+
+    return OSCHandlerPlan(apply, address_uniq, oscIndex, False, ring)
+
+# compiles all the handler data packages of an address -> handlers dictionary
+def compileOscHandlers(handlerDict):
+    plans = {}
+    for address, dataList in handlerDict.items():
+        plans[address] = tuple(compileOscHandler(address, index, data) for index, data in enumerate(dataList))
+    return plans
+
+def fillCallbackQue(address, oscArgs, plans):
+    put = OSC_callback_mailbox.put
+    push = OSC_callback_mailbox.push
+    for plan in plans:
+        if plan.immediate:
+            plan.apply(oscArgs)
+        elif plan.ring is None:
+            put(plan.key, plan.apply, oscArgs)
+        else:
+            push(plan.key, plan.apply, plan.ring, oscArgs)
@@ -17,6 +17,9 @@ def osc_export_config(scene):
             "loop_enable" : osc_item.loop_enable,
             "loop_range" : osc_item.loop_range,
             "enabled" : osc_item.enabled,
+            "delivery" : osc_item.delivery,
+            "delivery_size" : osc_item.delivery_size,
+            "rate" : osc_item.rate,
         }
 
     return json.dumps(config_table)
@@ -38,6 +41,9 @@ def osc_import_config(scene, config_file):
         item.loop_enable = values["loop_enable"]
         item.loop_range = values["loop_range"]
         item.enabled = values["enabled"]
+        item.delivery = values.get("delivery", "LATEST")
+        item.delivery_size = values.get("delivery_size", 16)
+        item.rate = values.get("rate", 0)
 
 def parse_ks(item):
     dp = item.data_path
@@ -117,6 +123,9 @@ class OSC_OT_ItemCreate(bpy.types.Operator):
             new_item.dp_format = keys[self.copy].dp_format
             new_item.loop_enable = keys[self.copy].loop_enable
             new_item.loop_range = keys[self.copy].loop_range
+            new_item.delivery = keys[self.copy].delivery
+            new_item.delivery_size = keys[self.copy].delivery_size
+            new_item.rate = keys[self.copy].rate
 
         # and now we move the new key to the index just below the original
         bpy.context.scene.NodeOSC_keys.move(index, self.copy + 1)
@@ -343,6 +352,9 @@ class NodeOSC_ImportKS(Operator):
                 item.loop_enable = tmp_item.loop_enable
                 item.loop_range = tmp_item.loop_range
                 item.enabled = tmp_item.enabled
+                item.delivery = tmp_item.delivery
+                item.delivery_size = tmp_item.delivery_size
+                item.rate = tmp_item.rate
                 item.idx = tmp_item.idx
 
         else:
@@ -10,12 +10,81 @@ to your requests and avoid repeating them in your code.
 import socket
 from time import sleep
 from sys import platform
+import errno
+import os
+from array import array
+from itertools import accumulate, chain
 
-from oscpy.parser import format_message, format_bundle
+from oscpy.parser import format_message, format_bundle, format_bundles
 from oscpy.stats import Stats
 
 SOCK = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
 
+# sendmmsg(2) sends several datagrams in one system call, only available
+# on linux
+_sendmmsg = None
+if platform.startswith('linux'):
+    try:
+        import ctypes
+        import ctypes.util
+
+        _sendmmsg = ctypes.CDLL(
+            ctypes.util.find_library('c'), use_errno=True
+        ).sendmmsg
+    except (ImportError, OSError, AttributeError):
+        _sendmmsg = None
+
+if _sendmmsg:
+    class _msghdr(ctypes.Structure):
+        _fields_ = [
+            ('msg_name', ctypes.c_void_p),
+            ('msg_namelen', ctypes.c_uint32),
+            ('msg_iov', ctypes.c_void_p),
+            ('msg_iovlen', ctypes.c_size_t),
+            ('msg_control', ctypes.c_void_p),
+            ('msg_controllen', ctypes.c_size_t),
+            ('msg_flags', ctypes.c_int),
+        ]
+
+    class _mmsghdr(ctypes.Structure):
+        _fields_ = [
+            ('msg_hdr', _msghdr),
+            ('msg_len', ctypes.c_uint),
+        ]
+
+    _sendmmsg.argtypes = [
+        ctypes.c_int, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int
+    ]
+    _sendmmsg.restype = ctypes.c_int
+
+    # the structures are filled as arrays of 64 bits words, an iovec
+    # being a (pointer, size) pair
+    if ctypes.sizeof(ctypes.c_void_p) == ctypes.sizeof(ctypes.c_size_t) == 8:
+        _HEADER_WORDS = ctypes.sizeof(_mmsghdr) // 8
+        _IOV_WORD = _msghdr.msg_iov.offset // 8
+        _IOVLEN_WORD = _msghdr.msg_iovlen.offset // 8
+    else:
+        _sendmmsg = None
+
+# most datagrams the kernel accepts in a sendmmsg call
+SENDMMSG_MAX = 1024
+
+
+def _send(sock, data, address):
+    """Send `data` to `address`, or to the peer of `sock` if it is None."""
+    if address is None:
+        try:
+            sock.send(data)
+        except ConnectionRefusedError:
+            # reported for a previous datagram, the peer was not listening
+            # yet, the error is now cleared: try again once
+            try:
+                sock.send(data)
+            except ConnectionRefusedError:
+                pass
+    else:
+        sock.sendto(data, address)
+
 
 def send_message(
     osc_address, values, ip_address, port, sock=SOCK, safer=False,
@@ -30,6 +99,8 @@ def send_message(
     - `ip_address` can either be an ip address if the used socket is of
       the AF_INET family, or a filename if the socket is of type AF_UNIX
     - `port` value will be ignored if socket is of type AF_UNIX
+    - if `ip_address` is None, the message is sent to the address `sock`
+      is connected to, see `OSCClient`'s `connect` parameter
     - `sock` should be a socket object, the client's default socket can be
       used as default
     - the `safer` parameter allows to wait a little after sending, to make
@@ -55,17 +126,111 @@ def send_message(
         send_message(b'/some/address', [1, 2, 3], b'/tmp/sock')
 
     """
-    if platform != 'win32' and sock.family == socket.AF_UNIX:
+    if ip_address is None:
+        address = None
+    elif platform != 'win32' and sock.family == socket.AF_UNIX:
         address = ip_address
     else:
         address = (ip_address, port)
 
     message, stats = format_message(
         osc_address, values, encoding=encoding,
-        encoding_errors=encoding_errors
+        encoding_errors=encoding_errors, reuse_buffer=True
     )
 
-    sock.sendto(message, address)
+    _send(sock, message, address)
+    if safer:
+        sleep(10e-9)
+
+    return stats
+
+
+def _send_many(sock, datagrams):
+    """Send `datagrams` (a list of bytes) to the peer of `sock`.
+
+    Use sendmmsg, to send them with as few system calls as possible.
+    """
+    count = len(datagrams)
+    # one buffer for all the datagrams, to only take its address once
+    data = b''.join(datagrams)
+    base = ctypes.cast(ctypes.c_char_p(data), ctypes.c_void_p).value
+    lengths = array('Q', map(len, datagrams))
+
+    iovecs = array('Q', bytes(16 * count))
+    iovecs[0::2] = array('Q', accumulate(chain((base, ), lengths[:-1])))
+    iovecs[1::2] = lengths
+    iovecs_address = iovecs.buffer_info()[0]
+
+    headers = array('Q', bytes(8 * _HEADER_WORDS * count))
+    headers[_IOV_WORD::_HEADER_WORDS] = array(
+        'Q', range(iovecs_address, iovecs_address + 16 * count, 16))
+    headers[_IOVLEN_WORD::_HEADER_WORDS] = array('Q', (1, )) * count
+    address = headers.buffer_info()[0]
+    size = 8 * _HEADER_WORDS
+
+    fd = sock.fileno()
+    sent = 0
+    refused = False
+    while sent < count:
+        result = _sendmmsg(
+            fd, address + sent * size, min(count - sent, SENDMMSG_MAX), 0
+        )
+        if result < 0:
+            error = ctypes.get_errno()
+            if error == errno.EINTR:
+                continue
+            if error == errno.ECONNREFUSED:
+                # see _send, the datagram is skipped if it happens twice
+                if refused:
+                    sent += 1
+                refused = True
+                continue
+            raise OSError(error, os.strerror(error))
+        sent += result
+        refused = False
+
+
+def send_many(
+    messages, ip_address, port, sock=None, safer=False,
+    encoding='', encoding_errors='strict'
+):
+    """Send each of the `messages` iterable as a separate datagram.
+
+    Each item in `messages` should be a two-tuple of the form
+    (address, values), see `send_bundle`. Use this instead of
+    `send_bundle` for receivers not supporting bundles.
+
+    If `ip_address` is None and `sock` is connected, the datagrams are
+    sent with sendmmsg where available (linux), in as few system calls as
+    possible. They are sent one by one otherwise.
+
+    Return the aggregated stats of the messages.
+    See `send_message` documentation for the other parameters.
+    """
+    if not sock:
+        sock = SOCK
+    stats = Stats()
+    datagrams = []
+    for osc_address, values in messages:
+        message, st = format_message(
+            osc_address, values, encoding=encoding,
+            encoding_errors=encoding_errors
+        )
+        datagrams.append(message)
+        stats += st
+
+    if ip_address is None and _sendmmsg and len(datagrams) > 1:
+        _send_many(sock, datagrams)
+    else:
+        if ip_address is None:
+            address = None
+        elif platform != 'win32' and sock.family == socket.AF_UNIX:
+            address = ip_address
+        else:
+            address = (ip_address, port)
+        for datagram in datagrams:
+            _send(sock, datagram, address)
+
     if safer:
         sleep(10e-9)
 
@@ -100,7 +265,35 @@ def send_bundle(
         messages, timetag=timetag, encoding=encoding,
         encoding_errors=encoding_errors
     )
-    sock.sendto(bundle, (ip_address, port))
+    _send(sock, bundle, None if ip_address is None else (ip_address, port))
+    if safer:
+        sleep(10e-9)
+
+    return stats
+
+
+def send_bundles(
+    messages, ip_address, port, max_size, timetag=None, sock=None,
+    safer=False, encoding='', encoding_errors='strict'
+):
+    """Send the `messages` iterable as bundles of at most `max_size` bytes.
+
+    Use this instead of `send_bundle` when the messages might not fit
+    into a single datagram, a new bundle is started every time the
+    current one would exceed `max_size` bytes.
+
+    See `send_bundle` documentation for the other parameters.
+    """
+    if not sock:
+        sock = SOCK
+    address = None if ip_address is None else (ip_address, port)
+    stats = Stats()
+    for bundle, st in format_bundles(
+        messages, max_size, timetag=timetag, encoding=encoding,
+        encoding_errors=encoding_errors
+    ):
+        _send(sock, bundle, address)
+        stats += st
     if safer:
         sleep(10e-9)
 
@@ -116,25 +309,74 @@ class OSCClient(object):
     """
 
     def __init__(
-        self, address, port, sock=None, encoding='', encoding_errors='strict'
+        self, address, port, sock=None, encoding='', encoding_errors='strict',
+        connect=False, sndbuf=None
     ):
         """Create an OSCClient.
 
         `address` and `port` are the destination of messages sent
         by this client. See `send_message` and `send_bundle` documentation
         for more information.
+
+        If `connect` is True, the client creates its own socket (unless
+        `sock` is given), resolves `address` once (IPv4, like the socket
+        used without `connect`) and connects the socket
+        to it, so datagrams are sent without resolving and checking the
+        destination every time. Datagrams refused by the destination
+        (nobody listening) are ignored. `sndbuf` sets the size in bytes of
+        the send buffer of the socket created by the client.
         """
         self.address = address
         self.port = port
-        self.sock = sock or SOCK
         self.encoding = encoding
         self.encoding_errors = encoding_errors
         self.stats = Stats()
+        self._own_sock = None
+
+        if connect:
+            family, type_, proto, _, destination = socket.getaddrinfo(
+                address, port, socket.AF_INET, socket.SOCK_DGRAM)[0]
+            if not sock:
+                sock = self._own_sock = socket.socket(family, type_, proto)
+            sock.connect(destination)
+            # the destination is the peer of the socket
+            self._destination = None
+        else:
+            if not sock and sndbuf:
+                sock = self._own_sock = socket.socket(
+                    socket.AF_INET, socket.SOCK_DGRAM)
+            self._destination = address
+
+        if sndbuf and self._own_sock:
+            self._own_sock.setsockopt(
+                socket.SOL_SOCKET, socket.SO_SNDBUF, sndbuf)
+
+        self.sock = sock or SOCK
+
+    def close(self):
+        """Close the socket created by the client, if any."""
+        if self._own_sock:
+            self._own_sock.close()
+            self._own_sock = None
 
     def send_message(self, address, values, safer=False):
         """Wrap the module level `send_message` function."""
         stats = send_message(
-            address, values, self.address, self.port, self.sock,
+            address, values, self._destination, self.port, self.sock,
+            safer=safer, encoding=self.encoding,
+            encoding_errors=self.encoding_errors
+        )
+        self.stats += stats
+        return stats
+
+    def send_many(self, messages, safer=False):
+        """Wrap the module level `send_many` function.
+
+        The datagrams are batched with sendmmsg if the client is connected
+        (see `connect`).
+        """
+        stats = send_many(
+            messages, self._destination, self.port, sock=self.sock,
             safer=safer, encoding=self.encoding,
             encoding_errors=self.encoding_errors
         )
@@ -144,7 +386,17 @@ class OSCClient(object):
     def send_bundle(self, messages, timetag=None, safer=False):
         """Wrap the module level `send_bundle` function."""
         stats = send_bundle(
-            messages, self.address, self.port, timetag=timetag,
+            messages, self._destination, self.port, timetag=timetag,
+            sock=self.sock, safer=safer, encoding=self.encoding,
+            encoding_errors=self.encoding_errors
+        )
+        self.stats += stats
+        return stats
+
+    def send_bundles(self, messages, max_size, timetag=None, safer=False):
+        """Wrap the module level `send_bundles` function."""
+        stats = send_bundles(
+            messages, self._destination, self.port, max_size, timetag=timetag,
             sock=self.sock, safer=safer, encoding=self.encoding,
             encoding_errors=self.encoding_errors
         )
@@ -13,17 +13,26 @@ Allowed types are:
 __all__ = (
     'parse',
     'read_packet', 'read_message', 'read_bundle',
-    'format_bundle', 'format_message',
+    'read_packet_headers', 'read_message_header', 'read_values', 'read_array',
+    'read_timetag',
+    'format_bundle', 'format_bundles', 'format_message',
     'MidiTuple',
 )
 
 
 from struct import Struct, pack, unpack_from, calcsize
 from time import time
+from array import array
 import sys
-from collections import Counter, namedtuple
+import threading
+from collections import Counter, OrderedDict, namedtuple
 from oscpy.stats import Stats
 
+try:  # pragma: no cover
+    from numpy import frombuffer
+except ImportError:  # pragma: no cover
+    frombuffer = None
+
 if sys.version_info.major > 2:  # pragma: no cover
     UNICODE = str
     izip = zip
@@ -209,8 +218,8 @@ def parse(hint, value, offset=0, encoding='', encoding_errors='strict'):
     )
 
 
-def format_message(address, values, encoding='', encoding_errors='strict'):
-    """Create a message."""
+def _format_message(address, values, encoding='', encoding_errors='strict'):
+    """Create a message, without using the template cache."""
     tags = [b',']
     fmt = []
 
@@ -286,11 +295,212 @@ def format_message(address, values, encoding='', encoding_errors='strict'):
     return message, Stats(1, len(message), lv, count)
 
 
-def read_message(data, offset=0, encoding='', encoding_errors='strict'):
+# types that can be formatted using a cached template, see `format_message`
+TEMPLATE_TYPES = {
+    float: b'f',
+    int: b'i',
+    bytes: b's',
+    UNICODE: b's',
+    MidiTuple: b'm',
+}
+
+# signatures of the most common types, bool being written as an int
+NUMBER_SIGNATURES = {
+    float: (b'f', 0),
+    int: (b'i', 0),
+    bool: (b'i', 0),
+}
+
+# maximal number of templates kept by each thread
+TEMPLATE_CACHE_SIZE = 1024
+
+_type_writers = {}
+_templates = threading.local()
+
+
+class MessageTemplate(object):
+    """Pre-encoded address and type tags of a message.
+
+    Only the values have to be packed, using `struct` and a reusable
+    buffer, to create a message with the same address and type signature.
+    """
+
+    __slots__ = ('struct', 'offset', 'buffer', 'params', 'types')
+
+    def __init__(self, address, signature, encoding='', encoding_errors='strict'):
+        tags = [b',']
+        fmt = [b'>']
+        for tag, size in signature:
+            tags.append(tag)
+            fmt.append(b'%is' % size if size else b'I' if tag == b'm' else tag)
+        tags = b''.join(tags + [NULL])
+
+        if encoding and isinstance(address, UNICODE):
+            address = address.encode(encoding, errors=encoding_errors)
+
+        if not address.endswith(NULL):
+            address += NULL
+
+        prefix = pack(
+            b'>%is%is' % (padded(len(address)), padded(len(tags))),
+            address, tags
+        )
+        self.struct = Struct(b''.join(fmt))
+        self.offset = len(prefix)
+        self.buffer = bytearray(prefix) + bytearray(self.struct.size)
+        self.params = len(signature)
+        self.types = Counter(tag.decode('utf8') for tag, size in signature)
+
+    def pack(self, values):
+        """Pack the values in the buffer of the template, and return it."""
+        self.struct.pack_into(self.buffer, self.offset, *values)
+        return self.buffer
+
+
+def _type_writer(cls):
+    """Return the template type `cls` is formatted as, None if there is none.
+
+    The result is the same as the one `WRITERS` gives for instances of `cls`.
+    """
+    if cls in _type_writers:
+        return _type_writers[cls]
+
+    writer = None
+    for cls_or_value, _ in WRITERS:
+        if isinstance(cls_or_value, type) and issubclass(cls, cls_or_value):
+            if cls_or_value in TEMPLATE_TYPES:
+                writer = cls_or_value
+            break
+    _type_writers[cls] = writer
+    return writer
+
+
+def format_message(
+    address, values, encoding='', encoding_errors='strict', reuse_buffer=False
+):
+    """Create a message.
+
+    Templates of the address and type tags are cached per thread, keyed on
+    the address and the type signature of the values, so repeated messages
+    only need to pack their values.
+
+    If `reuse_buffer` is true, the returned message is the buffer of the
+    template, it is only valid until the next message with the same
+    address and signature is formatted by the same thread.
+    """
+    signature = []
+    args = []
+    for value in values:
+        tag = NUMBER_SIGNATURES.get(value.__class__)
+        if tag is not None:
+            signature.append(tag)
+            args.append(value)
+            continue
+
+        cls = _type_writer(value.__class__)
+        if cls is None:
+            return _format_message(
+                address, values, encoding=encoding,
+                encoding_errors=encoding_errors
+            )
+
+        if cls is UNICODE:
+            if not encoding:
+                raise TypeError(u"Can't format unicode string without encoding")
+            value = value.encode(encoding, errors=encoding_errors)
+            cls = bytes
+
+        if cls is bytes:
+            signature.append((b's', padded(len(value) + 1)))
+        elif cls is MidiTuple:
+            signature.append((b'm', 0))
+            value = format_midi(value)
+        else:
+            signature.append((TEMPLATE_TYPES[cls], 0))
+        args.append(value)
+
+    key = (address, encoding, encoding_errors, tuple(signature))
+    cache = getattr(_templates, 'cache', None)
+    if cache is None:
+        cache = _templates.cache = OrderedDict()
+
+    template = cache.get(key)
+    if template is None:
+        template = cache[key] = MessageTemplate(
+            address, signature, encoding=encoding,
+            encoding_errors=encoding_errors
+        )
+        if len(cache) > TEMPLATE_CACHE_SIZE:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(key)
+
+    message = template.pack(args)
+    if not reuse_buffer:
+        message = bytes(message)
+    # copy the counter without going through Counter.update, which is slow
+    types = Counter.__new__(Counter)
+    dict.update(types, template.types)
+    return message, Stats(1, len(message), template.params, types)
+
+
+# numpy dtypes and array typecodes of the types that can be read as arrays
+ARRAY_TYPES = {
+    ord(b'f'): ('>f4', 'f'),
+    ord(b'i'): ('>i4', 'i'),
+}
+
+
+def array_tag(tags, threshold):
+    """Return the tag shared by all `tags`, if they can be read as an array.
+
+    That is, if there are at least `threshold` of them (0 disables arrays),
+    and they are all floats or all ints. Otherwise, return None.
+    """
+    if not threshold or len(tags) < threshold:
+        return None
+    tag = tags[0]
+    if tag in ARRAY_TYPES and tags.count(tag) == len(tags):
+        return tag
+    return None
+
+
+def read_array(data, tag, count, offset=0):
+    """Return `count` values of type `tag` from offset in data, as an array.
+
+    If numpy is available, the result is a read-only numpy array, it is a
+    view on `data` if data is bytes, otherwise the values are copied, so
+    `data` can be reused. Without numpy, an `array.array` is returned.
+    """
+    dtype, typecode = ARRAY_TYPES[tag]
+    size = 4 * count
+    if len(data) - offset < size:
+        raise ValueError(
+            'not enough data for {} values at {}'.format(count, offset))
+
+    if frombuffer is not None:
+        if not isinstance(data, bytes):
+            data = bytes(memoryview(data)[offset:offset + size])
+            offset = 0
+        return frombuffer(data, dtype, count, offset)
+
+    values = array(typecode, bytes(memoryview(data)[offset:offset + size]))
+    if sys.byteorder == 'little':
+        values.byteswap()
+    return values
+
+
+def read_message(
+    data, offset=0, encoding='', encoding_errors='strict', array_threshold=0
+):
     """Return address, tags, values, and length of a decoded message.
 
     Can be called either on a standalone message, or on a message
     extracted from a bundle.
+
+    If `array_threshold` is set, a message with at least that many
+    arguments, that are all floats or all ints, has a single value: the
+    array of its arguments, see `read_array`.
     """
     address, size = parse_string(data, offset=offset)
     index = size
@@ -304,6 +514,11 @@ def read_message(data, offset=0, encoding='', encoding_errors='strict'):
 
     index += size
 
+    tag = array_tag(tags, array_threshold)
+    if tag is not None:
+        values = [read_array(data, tag, len(tags), offset + index)]
+        return address, tags, values, index + 4 * len(tags)
+
     values = []
     for tag in tags:
         value, off = parse(
@@ -316,6 +531,85 @@ def read_message(data, offset=0, encoding='', encoding_errors='strict'):
     return address, tags, values, index
 
 
+def read_message_header(data, offset=0, end=None):
+    """Return address, tags and the offset of the values of a message.
+
+    Only the address and type tags are decoded, the values can be decoded
+    later using `read_values`. `data` can be a reused buffer (e.g a
+    bytearray filled by `recvfrom_into`), nothing after `end` is read.
+    """
+    if end is None:
+        end = len(data)
+
+    stop = data.find(NULL, offset, end)
+    if stop < 0:
+        raise ValueError("address at {} isn't null terminated".format(offset))
+    address = bytes(data[offset:stop])
+    if not address.startswith(b'/'):
+        raise ValueError("address {} doesn't start with a '/'".format(address))
+    index = offset + padded(stop - offset + 1)
+
+    stop = data.find(NULL, index, end)
+    if stop < 0:
+        raise ValueError("tag string at {} isn't null terminated".format(index))
+    tags = bytes(data[index:stop])
+    if not tags.startswith(b','):
+        raise ValueError("tag string {} doesn't start with a ','".format(tags))
+    index += padded(stop - index + 1)
+
+    return address, tags[1:], index
+
+
+def read_values(
+    data, tags, offset, end=None, encoding='', encoding_errors='strict',
+    array_threshold=0
+):
+    """Decode the values of a message, starting at offset in data.
+
+    `tags` and `offset` are the ones returned by `read_message_header`,
+    strings and blobs are copied out of `data`, so it can be reused
+    afterward.
+
+    See `read_message` for `array_threshold`.
+    """
+    if end is None:
+        end = len(data)
+
+    tag = array_tag(tags, array_threshold)
+    if tag is not None:
+        with memoryview(data)[:end] as view:
+            return [read_array(view, tag, len(tags), offset)]
+
+    values = []
+    with memoryview(data)[:end] as view:
+        for tag in tags:
+            if tag == 105:  # b'i'
+                values.append(INT.unpack_from(view, offset)[0])
+                offset += INT.size
+            elif tag == 102:  # b'f'
+                values.append(FLOAT.unpack_from(view, offset)[0])
+                offset += FLOAT.size
+            elif tag == 115 or tag == 83:  # b's', b'S'
+                stop = data.find(NULL, offset, end)
+                if stop < 0:
+                    raise ValueError(
+                        "string at {} isn't null terminated".format(offset))
+                value = bytes(view[offset:stop])
+                if encoding:
+                    value = value.decode(encoding, errors=encoding_errors)
+                values.append(value)
+                offset += padded(stop - offset + 1)
+            else:
+                value, off = parse(
+                    tag, view, offset=offset, encoding=encoding,
+                    encoding_errors=encoding_errors
+                )
+                values.append(value)
+                offset += off
+
+    return values
+
+
 def time_to_timetag(value):
     """Create a timetag from a time.
 
@@ -368,8 +662,51 @@ def format_bundle(data, timetag=None, encoding='', encoding_errors='strict'):
     return b''.join(bundle), stats
 
 
-def read_bundle(data, encoding='', encoding_errors='strict'):
-    """Decode a bundle into a (timestamp, messages) tuple."""
+def format_bundles(
+    data, max_size, timetag=None, encoding='', encoding_errors='strict'
+):
+    """Create as many bundles as needed from a list of (address, values) tuples.
+
+    Each bundle is at most `max_size` bytes long, except when a message
+    doesn't fit in a bundle on its own, it is then put alone in a bundle.
+    Return a list of (bundle, stats) tuples, in the order of `data`.
+
+    See `format_bundle` for the other parameters.
+    """
+    header = pack('8s', b'#bundle\0') + TIME_TAG.pack(*time_to_timetag(timetag))
+
+    bundles = []
+    bundle = [header]
+    size = len(header)
+    stats = Stats()
+    for address, values in data:
+        msg, st = format_message(
+            address, values, encoding=encoding,
+            encoding_errors=encoding_errors
+        )
+        length = INT.size + len(msg)
+        if len(bundle) > 1 and size + length > max_size:
+            bundles.append((b''.join(bundle), stats))
+            bundle = [header]
+            size = len(header)
+            stats = Stats()
+
+        bundle.append(INT.pack(len(msg)))
+        bundle.append(msg)
+        size += length
+        stats += st
+
+    if len(bundle) > 1:
+        bundles.append((b''.join(bundle), stats))
+
+    return bundles
+
+
+def read_bundle(data, encoding='', encoding_errors='strict', array_threshold=0):
+    """Decode a bundle into a (timestamp, messages) tuple.
+
+    See `read_message` for `array_threshold`.
+    """
     length = len(data)
 
     header = unpack_from('7s', data, 0)[0]
@@ -388,7 +725,8 @@ def read_bundle(data, encoding='', encoding_errors='strict'):
         # size = Int.unpack_from(data, offset)
         offset += INT.size
         address, tags, values, off = read_message(
-            data, offset, encoding=encoding, encoding_errors=encoding_errors
+            data, offset, encoding=encoding, encoding_errors=encoding_errors,
+            array_threshold=array_threshold
         )
         offset += off
         messages.append((address, tags, values, offset))
@@ -396,25 +734,31 @@ def read_bundle(data, encoding='', encoding_errors='strict'):
     return (timetag, messages)
 
 
-def read_packet(data, drop_late=False, encoding='', encoding_errors='strict'):
+def read_packet(
+    data, drop_late=False, encoding='', encoding_errors='strict',
+    array_threshold=0
+):
     """Detect if the data received is a simple message or a bundle, read it.
 
     Always return a list of messages.
     If drop_late is true, and the received data is an expired bundle,
     then returns an empty list.
+    See `read_message` for `array_threshold`.
     """
     header = unpack_from('>c', data, 0)[0]
     if header == b'/':
         return [
             read_message(
                 data, encoding=encoding,
-                encoding_errors=encoding_errors
+                encoding_errors=encoding_errors,
+                array_threshold=array_threshold
             )
         ]
 
     elif header == b'#':
         timetag, messages = read_bundle(
-            data, encoding=encoding, encoding_errors=encoding_errors
+            data, encoding=encoding, encoding_errors=encoding_errors,
+            array_threshold=array_threshold
         )
         if drop_late:
             if time() > timetag:
@@ -422,3 +766,65 @@ def read_packet(data, drop_late=False, encoding='', encoding_errors='strict'):
         return messages
     else:
         raise ValueError('packet is not a message or a bundle')
+
+
+def read_timetag(data):
+    """Return the time of the timetag of a bundle.
+
+    Return None if `data` is a message, or a bundle to be handled
+    immediately.
+    """
+    if data[0] != 35:  # b'#'
+        return None
+    timetag = TIME_TAG.unpack_from(data, 8)
+    if timetag == (0, 1):
+        return None
+    return timetag_to_time(timetag)
+
+
+def read_packet_headers(data, size=None, drop_late=False):
+    """Read the headers of the messages of a packet, without their values.
+
+    Return a list of (address, tags, offset, length) tuples, `offset`
+    being the position of the values of the message in `data`, to be
+    decoded using `read_values` if they are needed. Only the `size` first
+    bytes of `data` are read.
+
+    See `read_packet` for `drop_late`.
+    """
+    if size is None:
+        size = len(data)
+
+    if not size:
+        raise ValueError('packet is empty')
+
+    header = data[0]
+    if header == 47:  # b'/'
+        address, tags, offset = read_message_header(data, 0, size)
+        return [(address, tags, offset, size)]
+
+    elif header == 35:  # b'#'
+        if bytes(data[0:8]) != b'#bundle\0':
+            raise ValueError(
+                "the message doesn't start with '#bundle': {}"
+                .format(bytes(data[0:8])))
+
+        timetag = timetag_to_time(TIME_TAG.unpack_from(data, 8))
+        if drop_late and time() > timetag:
+            return []
+
+        offset = 8 + TIME_TAG.size
+        messages = []
+        while offset < size:
+            length = INT.unpack_from(data, offset)[0]
+            offset += INT.size
+            if length <= 0 or offset + length > size:
+                raise ValueError(
+                    'invalid bundle element size: {}'.format(length))
+            address, tags, index = read_message_header(
+                data, offset, offset + length)
+            messages.append((address, tags, index, length))
+            offset += length
+        return messages
+    else:
+        raise ValueError('packet is not a message or a bundle')
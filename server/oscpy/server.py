@@ -3,19 +3,24 @@
 This module currently only implements `OSCThreadServer`, a thread based server.
 """
 import logging
-from threading import Thread, Event
+from threading import Thread, Event, Condition, current_thread
 
 import os
 import re
 import inspect
 from sys import platform
-from time import sleep, time
+from time import time, monotonic
 from functools import partial
+from collections import Counter
+from heapq import heappush, heappop
+from itertools import count
 from select import select
 import socket
 
 from oscpy import __version__
-from oscpy.parser import read_packet, UNICODE
+from oscpy.parser import (
+    read_packet, read_packet_headers, read_values, read_timetag, UNICODE
+)
 from oscpy.client import send_bundle, send_message
 from oscpy.stats import Stats
 
@@ -47,6 +52,23 @@ def ServerClass(cls):
 
 __FILE__ = inspect.getfile(ServerClass)
 
+# number of incoming addresses whose matching routes are cached, when
+# advanced_matching is used
+ROUTES_CACHE_SIZE = 4096
+
+
+class _RouteNode(object):
+    """(internal) A level of the advanced matching index."""
+    __slots__ = ('literals', 'patterns', 'routes')
+
+    def __init__(self):
+        # literal part -> _RouteNode
+        self.literals = {}
+        # regexp pattern -> (regexp, _RouteNode)
+        self.patterns = {}
+        # keys of the routes ending at this level
+        self.routes = []
+
 
 class OSCThreadServer(object):
     """A thread-based OSC server.
@@ -60,13 +82,17 @@ class OSCThreadServer(object):
 
     def __init__(
         self, drop_late_bundles=False, timeout=0.01, advanced_matching=False,
-        encoding='', encoding_errors='strict', default_handler=None, intercept_errors=True
+        encoding='', encoding_errors='strict', default_handler=None, intercept_errors=True,
+        recv_into=False, batch_size=1, array_threshold=0,
+        schedule_bundles=False, latency_offset=0
     ):
         """Create an OSCThreadServer.
 
         - `timeout` is a number of seconds used as a time limit for
           select() calls in the listening thread, optiomal, defaults to
-          0.01.
+          0.01. With None, the listening thread sleeps until a packet is
+          received, it is woken up by `listen`, `stop` and
+          `terminate_server`.
         - `drop_late_bundles` instruct the server not to dispatch calls
           from bundles that arrived after their timetag value.
           (optional, defaults to False)
@@ -86,10 +112,42 @@ class OSCThreadServer(object):
         - `intercept_errors`, if True, means that exception raised by
           callbacks will be intercepted and logged. If False, the handler
           thread will terminate mostly silently on such exceptions.
+        - `recv_into` (defaults to False), setting this to True makes the
+          listening thread receive every packet into the same preallocated
+          buffer, and only decode the values of messages that a callback
+          or the `default_handler` is going to receive.
+        - `batch_size` (defaults to 1) is the maximal number of datagrams
+          received from a socket each time select() reports it readable.
+          With a value above 1, all the pending datagrams are received
+          without blocking, up to this number, the sizes of these batches
+          are counted in `batch_sizes`. Only available on platforms with
+          MSG_DONTWAIT (not Windows), elsewhere 1 is always used.
+        - `array_threshold` (defaults to 0, disabled), if set, messages
+          with at least this many arguments, all floats or all ints, are
+          given to callbacks as a single array of their values (a
+          read-only numpy array, or an `array.array` without numpy).
+        - `schedule_bundles` (defaults to False), setting this to True
+          makes the server hold the bundles with a future timetag, and
+          dispatch them once their time is reached, instead of at
+          reception. The listening thread keeps reading the sockets in
+          the meantime, the number of held bundles is `scheduled`.
+        - `latency_offset` is a number of seconds added to the future
+          timetags of the bundles to schedule (can be negative), to
+          compensate for a known latency between the server and the
+          sender.
         """
         self._must_loop = True
         self._termination_event = Event()
 
+        # written to wake the listening thread up from select()
+        self._wakeup_sockets = socket.socketpair()
+        for s in self._wakeup_sockets:
+            s.setblocking(False)
+        # counts the select() calls of the listening thread, for `stop`
+        # to know when a socket is not selected anymore
+        self._loops = 0
+        self._loops_condition = Condition()
+
         self.addresses = {}
         self.sockets = []
         self.timeout = timeout
@@ -100,6 +158,13 @@ class OSCThreadServer(object):
         self.encoding_errors = encoding_errors
         self.default_handler = default_handler
         self.intercept_errors = intercept_errors
+        self.recv_into = recv_into
+        self.batch_size = batch_size
+        self.array_threshold = array_threshold
+        self.schedule_bundles = schedule_bundles
+        self.latency_offset = latency_offset
+        self.batch_sizes = Counter()
+        self._scheduled = []
 
         self.stats_received = Stats()
         self.stats_sent = Stats()
@@ -111,6 +176,12 @@ class OSCThreadServer(object):
 
         self._smart_address_cache = {}
         self._smart_part_cache = {}
+        # source address of every smart address
+        self._smart_address_sources = {}
+        # index of the bound routes for advanced matching, built when
+        # needed, see `_find_routes`
+        self._routes = None
+        self._routes_cache = {}
 
     def bind(self, address, callback, sock=None, get_address=False):
         """Bind a callback to an osc address.
@@ -139,6 +210,7 @@ class OSCThreadServer(object):
         if cb not in callbacks:
             callbacks.append(cb)
         self.addresses[(sock, address)] = callbacks
+        self._clear_routes()
 
     def create_smart_address(self, address):
         """Create an advanced matching address from a string.
@@ -157,6 +229,7 @@ class OSCThreadServer(object):
                 re.compile(self._convert_part_to_regex(part)) for part in parts
             )
             cache[address] = smart_parts
+            self._smart_address_sources[smart_parts] = parts
             return smart_parts
 
     def _convert_part_to_regex(self, part):
@@ -211,6 +284,9 @@ class OSCThreadServer(object):
             address = address.encode(
                 self.encoding, errors=self.encoding_errors)
 
+        if self.advanced_matching:
+            address = self.create_smart_address(address)
+
         callbacks = self.addresses.get((sock, address), [])
         to_remove = []
         for cb in callbacks:
@@ -221,6 +297,101 @@ class OSCThreadServer(object):
             callbacks.remove(to_remove.pop())
 
         self.addresses[(sock, address)] = callbacks
+        self._clear_routes()
+
+    def _clear_routes(self):
+        """(internal) Invalidate the advanced matching index."""
+        self._routes_cache = {}
+        self._routes = None
+
+    def _build_routes(self):
+        """(internal) Index the bound routes for advanced matching.
+
+        Routes whose parts are all literal are indexed by their address,
+        the others are placed in a tree per socket, with a level per part
+        of their address: literal parts are looked up in a dict, the
+        others are matched using their regexp.
+        """
+        literals = {}
+        trees = {}
+        positions = {}
+        sources = self._smart_address_sources
+
+        for position, key in enumerate(list(self.addresses)):
+            positions[key] = position
+            sock, smart_address = key
+            parts = sources[smart_address]
+            literal = [
+                b',' not in part and re.escape(part) == part
+                for part in parts
+            ]
+            if all(literal):
+                literals[(sock, b'/'.join(parts))] = key
+                continue
+
+            node = trees.get(sock)
+            if node is None:
+                node = trees[sock] = _RouteNode()
+            for part, regex, is_literal in zip(parts, smart_address, literal):
+                if is_literal:
+                    child = node.literals.get(part)
+                    if child is None:
+                        child = node.literals[part] = _RouteNode()
+                else:
+                    entry = node.patterns.get(regex.pattern)
+                    if entry is None:
+                        entry = node.patterns[regex.pattern] = (regex, _RouteNode())
+                    child = entry[1]
+                node = child
+            node.routes.append(key)
+
+        routes = self._routes = (literals, trees, positions)
+        return routes
+
+    def _find_routes(self, sock, address):
+        """(internal) Return the keys of `addresses` matching `address`.
+
+        The keys are in binding order, they are cached per socket and
+        address until the next call to `bind` or `unbind`.
+        """
+        cache = self._routes_cache
+        key = (sock, address)
+        found = cache.get(key)
+        if found is not None:
+            return found
+
+        literals, trees, positions = self._routes or self._build_routes()
+
+        found = []
+        route = literals.get(key)
+        if route is not None:
+            found.append(route)
+
+        nodes = [trees[sock]] if sock in trees else []
+        for part in address.split(b'/'):
+            if not nodes:
+                break
+            children = []
+            for node in nodes:
+                child = node.literals.get(part)
+                if child is not None:
+                    children.append(child)
+                for regex, child in node.patterns.values():
+                    if regex.match(part):
+                        children.append(child)
+            nodes = children
+
+        for node in nodes:
+            found.extend(node.routes)
+
+        if len(found) > 1:
+            found.sort(key=positions.__getitem__)
+
+        found = tuple(found)
+        if len(cache) >= ROUTES_CACHE_SIZE:
+            cache.clear()
+        cache[key] = found
+        return found
 
     def listen(
         self, address='localhost', port=0, default=False, family='inet'
@@ -255,6 +426,7 @@ class OSCThreadServer(object):
             addr = (address, port)
         sock.bind(addr)
         self.sockets.append(sock)
+        self._wakeup()
         if default and not self.default_socket:
             self.default_socket = sock
         elif default:
@@ -305,11 +477,18 @@ class OSCThreadServer(object):
             s = self.default_socket
 
         if s in self.sockets:
-            read = select([s], [], [], 0)
-            s.close()
-            if s in read:
-                s.recvfrom(65535)
             self.sockets.remove(s)
+            thread = self._thread
+            if thread.is_alive() and thread is not current_thread():
+                # wait for the listening thread to select() again, without
+                # this socket, before closing it
+                with self._loops_condition:
+                    loops = self._loops
+                    self._wakeup()
+                    self._loops_condition.wait_for(
+                        lambda: self._loops != loops, timeout=1
+                    )
+            s.close()
         else:
             raise RuntimeError('{} is not one of my sockets!'.format(s))
 
@@ -317,7 +496,6 @@ class OSCThreadServer(object):
         """Call stop on all the existing sockets."""
         for s in self.sockets[:]:
             self.stop(s)
-        sleep(10e-9)
 
     def terminate_server(self):
         """Request the inner thread to finish its tasks and exit.
@@ -325,6 +503,21 @@ class OSCThreadServer(object):
         May be called from an event, too.
         """
         self._must_loop = False
+        self._wakeup()
+
+    def _wakeup(self):
+        """(internal) Wake the listening thread up from select()."""
+        try:
+            self._wakeup_sockets[1].send(b'\0')
+        except OSError:
+            # already pending, or the listening thread exited
+            pass
+
+    def _count_loop(self):
+        """(internal) Notify `stop` that the listening thread looped."""
+        with self._loops_condition:
+            self._loops += 1
+            self._loops_condition.notify_all()
 
     def join_server(self, timeout=None):
         """Wait for the server to exit (`terminate_server()` must have been called before).
@@ -332,11 +525,19 @@ class OSCThreadServer(object):
         Returns True if and only if the inner thread exited before timeout."""
         return self._termination_event.wait(timeout=timeout)
 
+    @property
+    def scheduled(self):
+        """Number of bundles held until their timetag (see `schedule_bundles`)."""
+        return len(self._scheduled)
+
     def _run_listener(self):
         """Wrapper just ensuring that the handler thread cleans up on exit."""
         try:
             self._listen()
         finally:
+            self._count_loop()
+            for s in self._wakeup_sockets:
+                s.close()
             self._termination_event.set()
 
     def _listen(self):
@@ -347,10 +548,101 @@ class OSCThreadServer(object):
         sockets, and calling the callbacks when messages are received.
         """
 
-        match = self._match_address
+        find_routes = self._find_routes
         advanced_matching = self.advanced_matching
         addresses = self.addresses
         stats = self.stats_received
+        recv_into = self.recv_into
+        buffer = bytearray(65535) if recv_into else None
+        scheduled = self._scheduled
+        counter = count()
+        wakeup = self._wakeup_sockets[0]
+        if self.batch_size > 1 and hasattr(socket, 'MSG_DONTWAIT'):
+            batch_size = self.batch_size
+            flags = socket.MSG_DONTWAIT
+        else:
+            batch_size = 1
+            flags = 0
+
+        def _receive(sock, drop_late):
+            """Receive datagrams from sock, and read their messages.
+
+            Up to `batch_size` datagrams are received, as long as some are
+            pending, the next one is only received once the messages of the
+            previous one have been handled.
+            """
+            count = 0
+            while count < batch_size:
+                try:
+                    if recv_into:
+                        size, sender = sock.recvfrom_into(buffer, 0, flags)
+                    else:
+                        data, sender = sock.recvfrom(65535, flags)
+                        size = len(data)
+                except (BlockingIOError, ConnectionResetError):
+                    break
+                count += 1
+
+                if recv_into:
+                    # values are left in the buffer, as offsets, until
+                    # we know someone is going to receive them
+                    messages = read_packet_headers(
+                        buffer, size, drop_late=drop_late
+                    )
+                else:
+                    messages = read_packet(
+                        data, drop_late=drop_late, encoding=self.encoding,
+                        encoding_errors=self.encoding_errors,
+                        array_threshold=self.array_threshold
+                    )
+
+                if self.schedule_bundles:
+                    timetag = read_timetag(buffer if recv_into else data)
+                    now = time()
+                    if timetag is not None and timetag > now:
+                        delay = timetag + self.latency_offset - now
+                        if delay > 0:
+                            _schedule(sock, sender, size, messages, delay)
+                            continue
+
+                yield sender, size, messages, recv_into
+
+            if count:
+                self.batch_sizes[count] += 1
+
+        def _schedule(sock, sender, size, messages, delay):
+            """Hold the messages of a bundle until `delay` seconds passed."""
+            if recv_into:
+                # the buffer will be overwritten by the next packet
+                messages = [
+                    (address, tags, read_values(
+                        buffer, tags, offset, size,
+                        encoding=self.encoding,
+                        encoding_errors=self.encoding_errors,
+                        array_threshold=self.array_threshold
+                    ), length)
+                    for address, tags, offset, length in messages
+                ]
+            # the counter keeps bundles due at the same time in order
+            heappush(
+                scheduled,
+                (monotonic() + delay, next(counter), sock, sender, messages)
+            )
+
+        def _due():
+            """Pop the scheduled bundles that are due."""
+            now = monotonic()
+            while scheduled and scheduled[0][0] <= now:
+                _, _, sock, sender, messages = heappop(scheduled)
+                yield sock, sender, messages
+
+        def _packets(read, drop_late):
+            """Yield the due bundles, then the packets of the read sockets."""
+            for sock, sender, messages in _due():
+                yield sock, sender, None, messages, False
+            for sock in read:
+                for sender, size, messages, buffered in _receive(sock, drop_late):
+                    yield sock, sender, size, messages, buffered
 
         def _execute_callbacks(_callbacks_list):
             for cb, get_address in _callbacks_list:
@@ -368,45 +660,61 @@ class OSCThreadServer(object):
         while self._must_loop:
 
             drop_late = self.drop_late_bundles
-            if not self.sockets:
-                sleep(.01)
+            timeout = self.timeout
+            if scheduled:
+                # wake up in time for the next scheduled bundle
+                delay = max(0, scheduled[0][0] - monotonic())
+                timeout = delay if timeout is None else min(timeout, delay)
+
+            self._count_loop()
+            try:
+                read, write, error = select(
+                    self.sockets + [wakeup], [], [], timeout
+                )
+            except (ValueError, socket.error):
                 continue
-            else:
-                try:
-                    read, write, error = select(self.sockets, [], [], self.timeout)
-                except (ValueError, socket.error):
-                    continue
 
-            for sender_socket in read:
+            if wakeup in read:
+                read.remove(wakeup)
                 try:
-                    data, sender = sender_socket.recvfrom(65535)
-                except ConnectionResetError:
-                    continue
-
-                for address, tags, values, offset in read_packet(
-                    data, drop_late=drop_late, encoding=self.encoding,
-                    encoding_errors=self.encoding_errors
-                ):
+                    while wakeup.recv(512):
+                        pass
+                except OSError:
+                    pass
+
+            # sender_socket and sender are looked up by get_sender()
+            for sender_socket, sender, size, messages, buffered in _packets(read, drop_late):
+                for address, tags, values, offset in messages:
                     stats.calls += 1
                     stats.bytes += offset
-                    stats.params += len(values)
+                    stats.params += len(tags)
                     stats.types.update(tags)
 
-                    matched = False
+                    callbacks_lists = []
                     if advanced_matching:
-                        for sock, addr in addresses:
-                            if sock == sender_socket and match(addr, address):
-                                callbacks_list = addresses.get((sock, addr), [])
-                                if callbacks_list:
-                                    matched = True
-                                    _execute_callbacks(callbacks_list)
+                        for route in find_routes(sender_socket, address):
+                            callbacks_list = addresses.get(route, [])
+                            if callbacks_list:
+                                callbacks_lists.append(callbacks_list)
                     else:
                         callbacks_list = addresses.get((sender_socket, address), [])
                         if callbacks_list:
-                            matched = True
-                            _execute_callbacks(callbacks_list)
+                            callbacks_lists.append(callbacks_list)
+
+                    if not callbacks_lists and not self.default_handler:
+                        continue
+
+                    if buffered:
+                        values = read_values(
+                            buffer, tags, values, size, encoding=self.encoding,
+                            encoding_errors=self.encoding_errors,
+                            array_threshold=self.array_threshold
+                        )
+
+                    for callbacks_list in callbacks_lists:
+                        _execute_callbacks(callbacks_list)
 
-                    if not matched and self.default_handler:
+                    if not callbacks_lists:
                         self.default_handler(address, *values)
 
     @staticmethod
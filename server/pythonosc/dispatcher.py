@@ -1,7 +1,9 @@
 """Class that maps OSC addresses to handlers."""
 import collections
+import heapq
 import logging
 import re
+import threading
 import time
 from pythonosc import osc_packet
 from typing import overload, List, Union, Any, Generator
@@ -36,12 +38,151 @@ class Handler(object):
                 self.callback(message.address, *message)
 
 
+class Scheduler(object):
+    """Holds timed messages and invokes their handlers when they are due.
+
+    The messages wait in a heap ordered by due time, a single thread started
+    with the first scheduled message sleeps until the earliest one is due.
+    Due times are converted to time.monotonic() when scheduling, so wall clock
+    adjustments don't move them.
+
+    Statistics:
+      - pending: Messages waiting in the queue.
+      - max_pending: The deepest the queue has been.
+      - released: Messages whose handlers were invoked.
+      - max_lateness, total_lateness: Delay in seconds between the due time of
+              the released messages and the invocation of their handlers.
+    """
+
+    def __init__(self) -> None:
+        self._queue = []
+        self._counter = 0
+        self._condition = threading.Condition()
+        self._thread = None
+        self._running = False
+        self.max_pending = 0
+        self.released = 0
+        self.max_lateness = 0.0
+        self.total_lateness = 0.0
+
+    @property
+    def pending(self) -> int:
+        return len(self._queue)
+
+    def stats(self) -> dict:
+        """Returns the statistics of the scheduler, see the class documentation."""
+        with self._condition:
+            return {
+                'pending': len(self._queue),
+                'max_pending': self.max_pending,
+                'released': self.released,
+                'max_lateness': self.max_lateness,
+                'mean_lateness': self.total_lateness / self.released if self.released else 0.0,
+            }
+
+    def schedule(self, timetag: float, handlers: List[Handler], client_address: str,
+                 message: OscMessage) -> None:
+        """Invokes the handlers with the message at timetag (system time, in seconds)."""
+        due = time.monotonic() + (timetag - time.time())
+        with self._condition:
+            # The counter keeps messages due at the same time in arrival order.
+            self._counter += 1
+            heapq.heappush(self._queue, (due, self._counter, handlers, client_address, message))
+            if len(self._queue) > self.max_pending:
+                self.max_pending = len(self._queue)
+            if not self._running:
+                self._running = True
+                self._thread = threading.Thread(target=self._run, name='OSC scheduler', daemon=True)
+                self._thread.start()
+            elif self._queue[0][1] == self._counter:
+                # The new message is the earliest one.
+                self._condition.notify()
+
+    def stop(self, timeout: float = None) -> None:
+        """Stops the thread, the pending messages are dropped."""
+        with self._condition:
+            self._running = False
+            self._queue.clear()
+            self._condition.notify()
+            thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def _run(self) -> None:
+        queue = self._queue
+        condition = self._condition
+        while True:
+            with condition:
+                while self._running:
+                    if queue:
+                        delay = queue[0][0] - time.monotonic()
+                        if delay <= 0:
+                            break
+                        condition.wait(delay)
+                    else:
+                        condition.wait()
+                if not self._running:
+                    return
+                due, _, handlers, client_address, message = heapq.heappop(queue)
+                lateness = time.monotonic() - due
+                self.released += 1
+                self.total_lateness += lateness
+                if lateness > self.max_lateness:
+                    self.max_lateness = lateness
+            for handler in handlers:
+                try:
+                    handler.invoke(client_address, message)
+                except Exception:
+                    logging.exception('Handler of scheduled message %s failed', message.address)
+
+
 class Dispatcher(object):
     """Register addresses to handlers and can match vice-versa."""
 
-    def __init__(self) -> None:
+    def __init__(self, cache_size: int = 1024, latency_offset: float = 0,
+                 array_threshold: int = 0) -> None:
+        """Initialize the dispatcher.
+
+        Args:
+          - cache_size: How many incoming addresses have their resolved
+                  handlers cached.
+          - latency_offset: Seconds added to the future timetags of bundles
+                  (can be negative), to compensate for a known latency
+                  between the server and the sender.
+          - array_threshold: Messages with at least this many arguments, all
+                  floats or all ints, are passed a single array of their
+                  arguments, see OscMessage. 0 disables it.
+        """
+        # Holds the messages of bundles with a future timetag.
+        self.scheduler = Scheduler()
+        self.latency_offset = latency_offset
+        self.array_threshold = array_threshold
         self._map = collections.defaultdict(list)
         self._default_handler = None
+        # Position of every mapped address in self._map, to keep the
+        # handlers in mapping order when resolving them from the index.
+        self._positions = {}
+        # Mapped addresses containing a '*', with their lazily compiled regex.
+        self._wildcards = {}
+        self._cache_size = cache_size
+        self._cache = collections.OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_generation = 0
+
+    def _handlers(self, address: str) -> List[Handler]:
+        """Returns the handlers list of an address, registering it if needed."""
+        handlers = self._map.get(address)
+        if handlers is None:
+            handlers = self._map[address] = []
+            self._positions[address] = len(self._positions)
+            if '*' in address:
+                self._wildcards[address] = None
+        return handlers
+
+    def _clear_cache(self) -> None:
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_generation += 1
 
     def map(self, address: str, handler: FunctionType, *args: Union[Any, List[Any]],
             needs_reply_address: bool = False) -> Handler:
@@ -62,7 +203,8 @@ class Dispatcher(object):
         # http://opensoundcontrol.org/spec-1_0
         # regarding multiple mappings
         handlerobj = Handler(handler, list(args), needs_reply_address)
-        self._map[address].append(handlerobj)
+        self._handlers(address).append(handlerobj)
+        self._clear_cache()
         return handlerobj
 
     @overload
@@ -94,15 +236,63 @@ class Dispatcher(object):
     def unmap(self, address, handler, *args, needs_reply_address=False):
         try:
             if isinstance(handler, Handler):
-                self._map[address].remove(handler)
+                self._handlers(address).remove(handler)
             else:
-                self._map[address].remove(Handler(handler, list(args), needs_reply_address))
+                self._handlers(address).remove(Handler(handler, list(args), needs_reply_address))
         except ValueError as e:
             if str(e) == "list.remove(x): x not in list":
                 raise ValueError("Address '%s' doesn't have handler '%s' mapped to it" % (address, handler)) from e
+        finally:
+            self._clear_cache()
 
     def handlers_for_address(self, address_pattern: str) -> Generator[None, Handler, None]:
-        """yields Handler namedtuples matching the given OSC pattern."""
+        """yields Handler namedtuples matching the given OSC pattern.
+
+        The handlers resolved for the last `cache_size` addresses are cached,
+        the cache is emptied by map(), unmap() and set_default_handler().
+        """
+        cache = self._cache
+        with self._cache_lock:
+            handlers = cache.get(address_pattern)
+            if handlers is not None:
+                cache.move_to_end(address_pattern)
+            generation = self._cache_generation
+
+        if handlers is None:
+            handlers = tuple(self._resolve_handlers(address_pattern))
+            with self._cache_lock:
+                # Don't cache handlers resolved while the mapping changed.
+                if generation == self._cache_generation:
+                    cache[address_pattern] = handlers
+                    if len(cache) > self._cache_size:
+                        cache.popitem(last=False)
+
+        yield from handlers
+
+    def _resolve_handlers(self, address_pattern: str) -> Generator[None, Handler, None]:
+        """yields Handler namedtuples matching the given OSC pattern, without the cache."""
+        if '?' not in address_pattern and '*' not in address_pattern:
+            # Without wildcards the pattern only matches its own address,
+            # so only the mapped addresses that have a '*' need a regex.
+            matches = []
+            if address_pattern in self._map:
+                matches.append(address_pattern)
+            for addr, regex in self._wildcards.items():
+                if regex is None:
+                    regex = self._wildcards[addr] = re.compile(addr.replace('*', '[^/]*?/*'))
+                if regex.match(address_pattern):
+                    matches.append(addr)
+            if len(matches) > 1:
+                matches.sort(key=self._positions.__getitem__)
+
+            for addr in matches:
+                yield from self._map[addr]
+
+            if not matches and self._default_handler:
+                logging.debug('No handler matched but default handler present, added it.')
+                yield self._default_handler
+            return
+
         # First convert the address_pattern into a matchable regexp.
         # '?' in the OSC Address Pattern matches any single character.
         # Let's consider numbers and _ "characters" too here, it's not said
@@ -133,6 +323,8 @@ class Dispatcher(object):
         This function calls the handlers registered to the dispatcher for
         every message it found in the packet.
         The process/thread granularity is thus the OSC packet, not the handler.
+        Messages with a future timetag are handed to self.scheduler, which
+        calls their handlers on its own thread when they are due.
 
         If parameters were registered with the dispatcher, then the handlers are
         called this way:
@@ -145,16 +337,19 @@ class Dispatcher(object):
 
         # Get OSC messages from all bundles or standalone message.
         try:
-            packet = osc_packet.OscPacket(data)
+            packet = osc_packet.OscPacket(data, self.array_threshold)
             for timed_msg in packet.messages:
                 now = time.time()
-                handlers = self.handlers_for_address(
-                    timed_msg.message.address)
+                handlers = tuple(self.handlers_for_address(
+                    timed_msg.message.address))
                 if not handlers:
                     continue
                 # If the message is to be handled later, then so be it.
                 if timed_msg.time > now:
-                    time.sleep(timed_msg.time - now)
+                    due = timed_msg.time + self.latency_offset
+                    if due > now:
+                        self.scheduler.schedule(due, handlers, client_address, timed_msg.message)
+                        continue
                 for handler in handlers:
                     handler.invoke(client_address, timed_msg.message)
         except osc_packet.ParseError:
@@ -167,3 +362,4 @@ class Dispatcher(object):
         or None to unset the default handler.
         """
         self._default_handler = None if (handler is None) else Handler(handler, [], needs_reply_address)
+        self._clear_cache()
@@ -18,17 +18,19 @@ class OscBundle(object):
     An element can be another OscBundle or an OscMessage.
     """
 
-    def __init__(self, dgram: bytes) -> None:
+    def __init__(self, dgram: bytes, array_threshold: int = 0) -> None:
         """Initializes the OscBundle with the given datagram.
 
         Args:
           dgram: a UDP datagram representing an OscBundle.
+          array_threshold: Passed to the contained messages, see OscMessage.
 
         Raises:
           ParseError: if the datagram could not be parsed into an OscBundle.
         """
         # Interesting stuff starts after the initial b"#bundle\x00".
         self._dgram = dgram
+        self._array_threshold = array_threshold
         index = len(_BUNDLE_PREFIX)
         try:
             self._timestamp, index = osc_types.get_date(self._dgram, index)
@@ -56,9 +58,9 @@ class OscBundle(object):
                 index += content_size
                 # Parse the content into an OSC message or bundle.
                 if OscBundle.dgram_is_bundle(content_dgram):
-                    contents.append(OscBundle(content_dgram))
+                    contents.append(OscBundle(content_dgram, self._array_threshold))
                 elif osc_message.OscMessage.dgram_is_message(content_dgram):
-                    contents.append(osc_message.OscMessage(content_dgram))
+                    contents.append(osc_message.OscMessage(content_dgram, self._array_threshold))
                 else:
                     logging.warning(
                         "Could not identify content type of dgram %s" % content_dgram)
@@ -4,9 +4,14 @@ from pythonosc import osc_bundle
 from pythonosc import osc_message
 from pythonosc.parsing import osc_types
 
+from typing import Iterable, List, Union
+
 # Shortcut to specify an immediate execution of messages in the bundle.
 IMMEDIATELY = osc_types.IMMEDIATELY
 
+# Datagram length in bytes of the bundle prefix and time tag.
+_BUNDLE_HEADER_LEN = 16
+
 
 class BuildError(Exception):
     """Error raised when an error occurs building the bundle."""
@@ -39,19 +44,71 @@ class OscBundleBuilder(object):
         Raises:
           - BuildError: if we could not build the bundle.
         """
-        dgram = b'#bundle\x00'
+        return osc_bundle.OscBundle(self.build_dgram())
+
+    def build_dgram(self) -> bytes:
+        """Build the datagram of the bundle, without parsing it into an OscBundle.
+
+        Contents can also be raw message or bundle datagrams.
+
+        Raises:
+          - BuildError: if we could not build the bundle.
+        """
+        parts = [b'#bundle\x00']
         try:
-            dgram += osc_types.write_date(self._timestamp)
+            parts.append(osc_types.write_date(self._timestamp))
             for content in self._contents:
                 if (type(content) == osc_message.OscMessage
                         or type(content) == osc_bundle.OscBundle):
-                    size = content.size
-                    dgram += osc_types.write_int(size)
-                    dgram += content.dgram
+                    parts.append(osc_types.write_int(content.size))
+                    parts.append(content.dgram)
+                elif isinstance(content, (bytes, bytearray)):
+                    parts.append(osc_types.write_int(len(content)))
+                    parts.append(content)
                 else:
                     raise BuildError(
                         "Content must be either OscBundle or OscMessage"
                         "found {}".format(type(content)))
-            return osc_bundle.OscBundle(dgram)
+            return b''.join(parts)
         except osc_types.BuildError as be:
             raise BuildError('Could not build the bundle {}'.format(be))
+
+
+def build_bundles(contents: Iterable[osc_message.OscMessage], max_size: int,
+                  timestamp: int = IMMEDIATELY,
+                  as_dgrams: bool = False) -> List[Union[osc_bundle.OscBundle, bytes]]:
+    """Build as many bundles as needed to hold all the contents.
+
+    Each bundle datagram is at most max_size bytes long, except for a
+    content which does not fit on its own, it is put alone into a bundle.
+
+    Args:
+      - contents: OscMessage or OscBundle instances, or raw datagrams,
+                  in sending order.
+      - max_size: maximal datagram length in bytes of a bundle.
+      - timestamp: see OscBundleBuilder.
+      - as_dgrams: return the datagrams of the bundles instead of
+                   OscBundle instances.
+
+    Raises:
+      - BuildError: if we could not build the bundles.
+    """
+    bundles = []
+    builder = OscBundleBuilder(timestamp)
+    size = _BUNDLE_HEADER_LEN
+    build = OscBundleBuilder.build_dgram if as_dgrams else OscBundleBuilder.build
+    for content in contents:
+        # Every content is preceded by its size as an int32.
+        if isinstance(content, (bytes, bytearray)):
+            content_size = osc_types._INT_DGRAM_LEN + len(content)
+        else:
+            content_size = osc_types._INT_DGRAM_LEN + content.size
+        if builder._contents and size + content_size > max_size:
+            bundles.append(build(builder))
+            builder = OscBundleBuilder(timestamp)
+            size = _BUNDLE_HEADER_LEN
+        builder.add_content(content)
+        size += content_size
+    if builder._contents:
+        bundles.append(build(builder))
+    return bundles
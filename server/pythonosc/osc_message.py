@@ -1,15 +1,72 @@
 """Representation of an OSC message in a pythonesque way."""
 
+import collections
 import logging
+import struct
+import threading
 
 from pythonosc.parsing import osc_types
-from typing import List, Iterator, Any
+from typing import List, Iterator, Any, Optional
 
 
 class ParseError(Exception):
     """Base exception raised when a datagram parsing error occurs."""
 
 
+# struct formats of the fixed-width types a signature decoder can unpack.
+_FIXED_WIDTH_FORMATS = {
+    'i': 'i',  # Integer.
+    'f': 'f',  # Float.
+    'd': 'd',  # Double.
+    'r': 'I',  # RGBA.
+}
+
+
+class SignatureDecoders(object):
+    """Bounded cache of decoders for type signatures of fixed-width types.
+
+    A signature only made of fixed-width types (like 'fff') is compiled into
+    a single struct.Struct unpacking all the arguments at once. Signatures
+    with other types are cached as None, to be parsed argument by argument.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._decoders = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, type_tag: str) -> Optional[struct.Struct]:
+        """Returns the decoder of a type signature, None if it has none."""
+        with self._lock:
+            try:
+                decoder = self._decoders[type_tag]
+            except KeyError:
+                pass
+            else:
+                self._decoders.move_to_end(type_tag)
+                self.hits += 1
+                return decoder
+
+        decoder = None
+        if type_tag and all(tag in _FIXED_WIDTH_FORMATS for tag in type_tag):
+            decoder = struct.Struct('>' + ''.join(_FIXED_WIDTH_FORMATS[tag] for tag in type_tag))
+
+        with self._lock:
+            self.misses += 1
+            self._decoders[type_tag] = decoder
+            if len(self._decoders) > self.maxsize:
+                self._decoders.popitem(last=False)
+        return decoder
+
+    def clear(self) -> None:
+        with self._lock:
+            self._decoders.clear()
+            self.hits = 0
+            self.misses = 0
+
+
 class OscMessage(object):
     """Representation of a parsed datagram representing an OSC message.
 
@@ -17,8 +74,19 @@ class OscMessage(object):
     Type Tag String followed by zero or more OSC Arguments.
     """
 
-    def __init__(self, dgram: bytes) -> None:
+    # Decoders of the type signatures of fixed-width types, shared by all messages.
+    signature_decoders = SignatureDecoders()
+
+    def __init__(self, dgram: bytes, array_threshold: int = 0) -> None:
+        """Initializes the OscMessage with the given datagram.
+
+        Args:
+          - array_threshold: Messages with at least this many arguments, all
+                  floats or all ints, have a single parameter: an array of
+                  their arguments, see osc_types.get_array. 0 disables it.
+        """
         self._dgram = dgram
+        self._array_threshold = array_threshold
         self._parameters = []
         self._parse_datagram()
 
@@ -34,6 +102,20 @@ class OscMessage(object):
             if type_tag.startswith(','):
                 type_tag = type_tag[1:]
 
+            threshold = self._array_threshold
+            if threshold and len(type_tag) >= threshold and type_tag[0] in 'fi' \
+                    and type_tag.count(type_tag[0]) == len(type_tag):
+                val, index = osc_types.get_array(self._dgram, index, type_tag[0], len(type_tag))
+                self._parameters = [val]
+                return
+
+            # Decode all the arguments at once when the signature allows it,
+            # short datagrams are left to the per argument parsers.
+            decoder = self.signature_decoders.get(type_tag)
+            if decoder is not None and len(self._dgram) - index >= decoder.size:
+                self._parameters = list(decoder.unpack_from(self._dgram, index))
+                return
+
             params = []
             param_stack = [params]
             # Parse each parameter given its type.
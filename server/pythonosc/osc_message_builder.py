@@ -1,14 +1,25 @@
 """Build OSC messages for client applications."""
 
+import struct
+
 from pythonosc import osc_message
 from pythonosc.parsing import osc_types
 
-from typing import List, Tuple, Union, Any
+from typing import List, Tuple, Union, Any, Sequence
 
 class BuildError(Exception):
     """Error raised when an incomplete message is trying to be built."""
 
 
+# struct formats of the argument types that have a fixed width.
+_FIXED_WIDTH_FORMATS = {
+    "f": "f",
+    "d": "d",
+    "i": "i",
+    "r": "I",
+}
+
+
 class OscMessageBuilder(object):
     """Builds arbitrary OscMessage instances."""
 
@@ -125,34 +136,42 @@ class OscMessageBuilder(object):
         Returns:
           - an osc_message.OscMessage instance.
         """
+        return osc_message.OscMessage(self.build_dgram())
+
+    def build_dgram(self) -> bytes:
+        """Builds the datagram of the message from the current state of this builder.
+
+        Unlike build(), the datagram is not parsed back into an OscMessage,
+        it is meant to be sent as is, e.g. with UDPClient.send().
+
+        Raises:
+          - BuildError: if the message could not be build or if the address
+                        was empty.
+
+        Returns:
+          - the datagram as bytes.
+        """
         if not self._address:
             raise BuildError('OSC addresses cannot be empty')
-        dgram = b''
         try:
-            # Write the address.
-            dgram += osc_types.write_string(self._address)
-            if not self._args:
-                dgram += osc_types.write_string(',')
-                return osc_message.OscMessage(dgram)
-
-            # Write the parameters.
+            # Write the address and the type tags.
             arg_types = "".join([arg[0] for arg in self._args])
-            dgram += osc_types.write_string(',' + arg_types)
+            parts = [osc_types.write_string(self._address),
+                     osc_types.write_string(',' + arg_types)]
+            fmt = ['>%ds%ds' % (len(parts[0]), len(parts[1]))]
+
+            # Write the parameters, all of them are packed at once in the end.
             for arg_type, value in self._args:
-                if arg_type == self.ARG_TYPE_STRING:
-                    dgram += osc_types.write_string(value)
-                elif arg_type == self.ARG_TYPE_INT:
-                    dgram += osc_types.write_int(value)
-                elif arg_type == self.ARG_TYPE_FLOAT:
-                    dgram += osc_types.write_float(value)
-                elif arg_type == self.ARG_TYPE_DOUBLE:
-                    dgram += osc_types.write_double(value)
+                if arg_type in _FIXED_WIDTH_FORMATS:
+                    fmt.append(_FIXED_WIDTH_FORMATS[arg_type])
+                    parts.append(value)
+                    continue
+                elif arg_type == self.ARG_TYPE_STRING:
+                    value = osc_types.write_string(value)
                 elif arg_type == self.ARG_TYPE_BLOB:
-                    dgram += osc_types.write_blob(value)
-                elif arg_type == self.ARG_TYPE_RGBA:
-                    dgram += osc_types.write_rgba(value)
+                    value = osc_types.write_blob(value)
                 elif arg_type == self.ARG_TYPE_MIDI:
-                    dgram += osc_types.write_midi(value)
+                    value = osc_types.write_midi(value)
                 elif arg_type in (self.ARG_TYPE_TRUE,
                                   self.ARG_TYPE_FALSE,
                                   self.ARG_TYPE_ARRAY_START,
@@ -161,7 +180,69 @@ class OscMessageBuilder(object):
                 else:
                     raise BuildError('Incorrect parameter type found {}'.format(
                         arg_type))
+                fmt.append('%ds' % len(value))
+                parts.append(value)
 
-            return osc_message.OscMessage(dgram)
+            return struct.pack(''.join(fmt), *parts)
+        except struct.error as e:
+            raise BuildError('Could not build the message: Wrong argument value passed: {}'.format(e))
         except osc_types.BuildError as be:
             raise BuildError('Could not build the message: {}'.format(be))
+
+
+class FixedSignatureBuilder(object):
+    """Builds the datagrams of messages sharing an address and a signature.
+
+    Only fixed-width argument types can be used, the address and the type
+    tags are written once, and every datagram is packed into the same buffer.
+    """
+
+    def __init__(self, address: str, arg_types: str) -> None:
+        """Initialize a builder for messages of the given type signature.
+
+        Args:
+          - address: The osc address to send the messages to.
+          - arg_types: The types of the arguments, made of the float, double,
+                       int and rgba OscMessageBuilder.ARG_TYPE_* values.
+        Raises:
+          - ValueError: if a type is not supported.
+          - BuildError: if the address is empty or can't be written.
+        """
+        for arg_type in arg_types:
+            if arg_type not in _FIXED_WIDTH_FORMATS:
+                raise ValueError(
+                    'arg_types must be made of {}'.format(tuple(_FIXED_WIDTH_FORMATS)))
+        if not address:
+            raise BuildError('OSC addresses cannot be empty')
+        try:
+            prefix = (osc_types.write_string(address) +
+                      osc_types.write_string(',' + arg_types))
+        except osc_types.BuildError as be:
+            raise BuildError('Could not build the message: {}'.format(be))
+        self._address = address
+        self._arg_types = arg_types
+        self._struct = struct.Struct('>' + ''.join(_FIXED_WIDTH_FORMATS[t] for t in arg_types))
+        self._offset = len(prefix)
+        self._dgram = bytearray(prefix) + bytearray(self._struct.size)
+
+    @property
+    def address(self) -> str:
+        """Returns the OSC address the messages are sent to."""
+        return self._address
+
+    @property
+    def arg_types(self) -> str:
+        """Returns the type signature of the messages."""
+        return self._arg_types
+
+    def build_dgram(self, values: Sequence[Union[int, float]]) -> bytes:
+        """Builds the datagram of a message with the given argument values.
+
+        Raises:
+          - BuildError: if the values don't match the signature.
+        """
+        try:
+            self._struct.pack_into(self._dgram, self._offset, *values)
+        except struct.error as e:
+            raise BuildError('Could not build the message: Wrong argument value passed: {}'.format(e))
+        return bytes(self._dgram)
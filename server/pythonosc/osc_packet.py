@@ -47,11 +47,12 @@ class OscPacket(object):
     Any application that receives OSC Packets is an OSC Server.
     """
 
-    def __init__(self, dgram: bytes) -> None:
+    def __init__(self, dgram: bytes, array_threshold: int = 0) -> None:
         """Initialize an OdpPacket with the given UDP datagram.
 
         Args:
           - dgram: the raw UDP datagram holding the OSC packet.
+          - array_threshold: Passed to the messages, see OscMessage.
 
         Raises:
           - ParseError if the datagram could not be parsed.
@@ -60,10 +61,10 @@ class OscPacket(object):
         try:
             if osc_bundle.OscBundle.dgram_is_bundle(dgram):
                 self._messages = sorted(
-                    _timed_msg_of_bundle(osc_bundle.OscBundle(dgram), now),
+                    _timed_msg_of_bundle(osc_bundle.OscBundle(dgram, array_threshold), now),
                     key=lambda x: x.time)
             elif osc_message.OscMessage.dgram_is_message(dgram):
-                self._messages = [TimedMessage(now, osc_message.OscMessage(dgram))]
+                self._messages = [TimedMessage(now, osc_message.OscMessage(dgram, array_threshold))]
             else:
                 # Empty packet, should not happen as per the spec but heh, UDP...
                 raise ParseError(
@@ -32,7 +32,10 @@ loop.run_forever()
 
 import asyncio
 import os
+import selectors
+import socket
 import socketserver
+import threading
 
 from pythonosc import osc_bundle
 from pythonosc import osc_message
@@ -74,6 +77,61 @@ class OSCUDPServer(socketserver.UDPServer):
     def __init__(self, server_address: Tuple[str, int], dispatcher: Dispatcher) -> None:
         super().__init__(server_address, _UDPHandler)
         self._dispatcher = dispatcher
+        # Written by shutdown() to wake serve_forever() up.
+        self._wakeup_sockets = socket.socketpair()
+        for sock in self._wakeup_sockets:
+            sock.setblocking(False)
+        self._shutdown_request = False
+        self._is_shut_down = threading.Event()
+        self._is_shut_down.set()
+
+    def serve_forever(self, poll_interval: float = None) -> None:
+        """Handle requests until shutdown().
+
+        Unlike socketserver's, it sleeps until a request arrives or shutdown()
+        is called, unless a poll_interval (in seconds) is given.
+        """
+        self._is_shut_down.clear()
+        wakeup = self._wakeup_sockets[0]
+        try:
+            with selectors.DefaultSelector() as selector:
+                selector.register(self, selectors.EVENT_READ)
+                selector.register(wakeup, selectors.EVENT_READ)
+                while not self._shutdown_request:
+                    ready = selector.select(poll_interval)
+                    if self._shutdown_request:
+                        break
+                    for key, _ in ready:
+                        if key.fileobj is wakeup:
+                            try:
+                                while wakeup.recv(512):
+                                    pass
+                            except OSError:
+                                pass
+                        else:
+                            self._handle_request_noblock()
+                    self.service_actions()
+        finally:
+            self._shutdown_request = False
+            self._is_shut_down.set()
+
+    def shutdown(self) -> None:
+        """Stops the serve_forever loop and waits until it exits.
+
+        Must be called from another thread than the one running serve_forever(),
+        or it will deadlock.
+        """
+        self._shutdown_request = True
+        try:
+            self._wakeup_sockets[1].send(b'\0')
+        except OSError:
+            pass
+        self._is_shut_down.wait()
+
+    def server_close(self) -> None:
+        super().server_close()
+        for sock in self._wakeup_sockets:
+            sock.close()
 
     def verify_request(self, request: List[bytes], client_address: Tuple[str, int]) -> bool:
         """Returns true if the data looks like a valid OSC UDP datagram."""
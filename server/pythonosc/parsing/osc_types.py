@@ -2,11 +2,18 @@
 
 import decimal
 import struct
+import sys
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 from pythonosc.parsing import ntp
 from datetime import datetime, timedelta, date
 
-from typing import Union, Tuple
+from typing import Union, Tuple, Any
 
 
 class ParseError(Exception):
@@ -29,6 +36,19 @@ _DATE_DGRAM_LEN = _INT_DGRAM_LEN * 2
 _STRING_DGRAM_PAD = 4
 _BLOB_DGRAM_PAD = 4
 
+_INT = struct.Struct('>i')
+_UINT = struct.Struct('>I')
+_DATE = struct.Struct('>II')
+_FLOAT = struct.Struct('>f')
+_DOUBLE = struct.Struct('>d')
+
+
+def _remaining(dgram: bytes, start_index: int) -> int:
+    """Returns len(dgram[start_index:]) without copying the datagram."""
+    if start_index >= 0:
+        return max(len(dgram) - start_index, 0)
+    return min(-start_index, len(dgram))
+
 
 def write_string(val: str) -> bytes:
     """Returns the OSC string equivalent of the given python string.
@@ -63,10 +83,15 @@ def get_string(dgram: bytes, start_index: int) -> Tuple[str, int]:
     Raises:
       ParseError if the datagram could not be parsed.
     """
-    offset = 0
     try:
-        while dgram[start_index + offset] != 0:
-            offset += 1
+        if start_index < 0:
+            start_index += len(dgram)
+            if start_index < 0:
+                raise IndexError('index out of range')
+        end_index = dgram.find(b'\x00', start_index)
+        if end_index < 0:
+            raise IndexError('index out of range')
+        offset = end_index - start_index
         if offset == 0:
             raise ParseError(
                 'OSC string cannot begin with a null byte: %s' % dgram[start_index:])
@@ -77,13 +102,13 @@ def get_string(dgram: bytes, start_index: int) -> Tuple[str, int]:
             offset += (-offset % _STRING_DGRAM_PAD)
         # Python slices do not raise an IndexError past the last index,
         # do it ourselves.
-        if offset > len(dgram[start_index:]):
+        if offset > len(dgram) - start_index:
             raise ParseError('Datagram is too short')
         data_str = dgram[start_index:start_index + offset]
         return data_str.replace(b'\x00', b'').decode('utf-8'), start_index + offset
     except IndexError as ie:
         raise ParseError('Could not parse datagram %s' % ie)
-    except TypeError as te:
+    except (TypeError, AttributeError) as te:
         raise ParseError('Could not parse datagram %s' % te)
 
 
@@ -94,7 +119,7 @@ def write_int(val: int) -> bytes:
       - BuildError if the int could not be converted.
     """
     try:
-        return struct.pack('>i', val)
+        return _INT.pack(val)
     except struct.error as e:
         raise BuildError('Wrong argument value passed: {}'.format(e))
 
@@ -113,12 +138,9 @@ def get_int(dgram: bytes, start_index: int) -> Tuple[int, int]:
       ParseError if the datagram could not be parsed.
     """
     try:
-        if len(dgram[start_index:]) < _INT_DGRAM_LEN:
+        if _remaining(dgram, start_index) < _INT_DGRAM_LEN:
             raise ParseError('Datagram is too short')
-        return (
-            struct.unpack('>i',
-                          dgram[start_index:start_index + _INT_DGRAM_LEN])[0],
-            start_index + _INT_DGRAM_LEN)
+        return _INT.unpack_from(dgram, start_index)[0], start_index + _INT_DGRAM_LEN
     except (struct.error, TypeError) as e:
         raise ParseError('Could not parse datagram %s' % e)
 
@@ -141,7 +163,7 @@ def get_ttag(dgram: bytes, start_index: int) -> Tuple[datetime, int]:
     _TTAG_DGRAM_LEN = 8
 
     try:
-        if len(dgram[start_index:]) < _TTAG_DGRAM_LEN:
+        if _remaining(dgram, start_index) < _TTAG_DGRAM_LEN:
             raise ParseError('Datagram is too short')
 
         seconds, idx = get_int(dgram, start_index)
@@ -171,7 +193,7 @@ def write_float(val: float) -> bytes:
       - BuildError if the float could not be converted.
     """
     try:
-        return struct.pack('>f', val)
+        return _FLOAT.pack(val)
     except struct.error as e:
         raise BuildError('Wrong argument value passed: {}'.format(e))
 
@@ -190,19 +212,65 @@ def get_float(dgram: bytes, start_index: int) -> Tuple[float, int]:
       ParseError if the datagram could not be parsed.
     """
     try:
-        if len(dgram[start_index:]) < _FLOAT_DGRAM_LEN:
+        remaining = _remaining(dgram, start_index)
+        if remaining < _FLOAT_DGRAM_LEN:
             # Noticed that Reaktor doesn't send the last bunch of \x00 needed to make
             # the float representation complete in some cases, thus we pad here to
             # account for that.
-            dgram = dgram + b'\x00' * (_FLOAT_DGRAM_LEN - len(dgram[start_index:]))
-        return (
-            struct.unpack('>f',
-                          dgram[start_index:start_index + _FLOAT_DGRAM_LEN])[0],
-            start_index + _FLOAT_DGRAM_LEN)
+            dgram = dgram + b'\x00' * (_FLOAT_DGRAM_LEN - remaining)
+            return (
+                struct.unpack('>f',
+                              dgram[start_index:start_index + _FLOAT_DGRAM_LEN])[0],
+                start_index + _FLOAT_DGRAM_LEN)
+        return _FLOAT.unpack_from(dgram, start_index)[0], start_index + _FLOAT_DGRAM_LEN
     except (struct.error, TypeError) as e:
         raise ParseError('Could not parse datagram %s' % e)
 
 
+# numpy dtypes and array typecodes of the types get_array can read.
+_ARRAY_TYPES = {
+    'f': ('>f4', 'f'),
+    'i': ('>i4', 'i'),
+}
+
+
+def get_array(dgram: bytes, start_index: int, arg_type: str, count: int) -> Tuple[Any, int]:
+    """Get count consecutive 32-bit floats or integers from the datagram as an array.
+
+    Args:
+      dgram: A datagram packet.
+      start_index: An index where the first value starts in the datagram.
+      arg_type: 'f' for floats, 'i' for integers.
+      count: The number of values.
+
+    Returns:
+      A tuple containing the array and the new end index. The array is a
+      read-only numpy array viewing the datagram if numpy is available,
+      an array.array otherwise.
+
+    Raises:
+      ParseError if the datagram could not be parsed.
+    """
+    try:
+        dtype, typecode = _ARRAY_TYPES[arg_type]
+    except KeyError:
+        raise ParseError('Unsupported array type: {}'.format(arg_type))
+    end_index = start_index + count * _INT_DGRAM_LEN
+    if start_index < 0 or end_index > len(dgram):
+        raise ParseError('Datagram is too short')
+    if numpy is not None:
+        if not isinstance(dgram, bytes):
+            # do not view a buffer that can be modified later
+            dgram, start_index = bytes(dgram[start_index:end_index]), 0
+        values = numpy.frombuffer(dgram, dtype, count, start_index)
+        values.flags.writeable = False
+        return values, end_index
+    values = array(typecode, dgram[start_index:end_index])
+    if sys.byteorder == 'little':
+        values.byteswap()
+    return values, end_index
+
+
 def write_double(val: float) -> bytes:
     """Returns the datagram for the given double parameter value
 
@@ -210,7 +278,7 @@ def write_double(val: float) -> bytes:
       - BuildError if the double could not be converted.
     """
     try:
-        return struct.pack('>d', val)
+        return _DOUBLE.pack(val)
     except struct.error as e:
         raise BuildError('Wrong argument value passed: {}'.format(e))
 
@@ -229,12 +297,9 @@ def get_double(dgram: bytes, start_index: int) -> Tuple[float, int]:
       ParseError if the datagram could not be parsed.
     """
     try:
-        if len(dgram[start_index:]) < _DOUBLE_DGRAM_LEN:
+        if _remaining(dgram, start_index) < _DOUBLE_DGRAM_LEN:
             raise ParseError('Datagram is too short')
-        return (
-            struct.unpack('>d',
-                          dgram[start_index:start_index + _DOUBLE_DGRAM_LEN])[0],
-            start_index + _DOUBLE_DGRAM_LEN)
+        return _DOUBLE.unpack_from(dgram, start_index)[0], start_index + _DOUBLE_DGRAM_LEN
     except (struct.error, TypeError) as e:
         raise ParseError('Could not parse datagram {}'.format(e))
 
@@ -261,7 +326,7 @@ def get_blob(dgram: bytes, start_index: int) -> Tuple[bytes, int]:
     # Make the size a multiple of 32 bits.
     total_size = size + (-size % _BLOB_DGRAM_PAD)
     end_index = int_offset + size
-    if end_index - start_index > len(dgram[start_index:]):
+    if end_index - start_index > _remaining(dgram, start_index):
         raise ParseError('Datagram is too short.')
     return dgram[int_offset:int_offset + size], int_offset + total_size
 
@@ -303,10 +368,11 @@ def get_date(dgram: bytes, start_index: int) -> Tuple[Union[int, float], int]:
     # Check for the special case first.
     if dgram[start_index:start_index + _DATE_DGRAM_LEN] == ntp.IMMEDIATELY:
         return IMMEDIATELY, start_index + _DATE_DGRAM_LEN
-    if len(dgram[start_index:]) < _DATE_DGRAM_LEN:
+    if _remaining(dgram, start_index) < _DATE_DGRAM_LEN:
         raise ParseError('Datagram is too short')
-    num_secs, start_index = get_int(dgram, start_index)
-    fraction, start_index = get_int(dgram, start_index)
+    # Both parts are unsigned: NTP seconds went over 2**31 in 1968.
+    num_secs, fraction = _DATE.unpack_from(dgram, start_index)
+    start_index += _DATE_DGRAM_LEN
     # Sum seconds and fraction of second:
     system_time = num_secs + (fraction / ntp.FRACTIONAL_CONVERSION)
 
@@ -330,7 +396,7 @@ def write_rgba(val: bytes) -> bytes:
       - BuildError if the int could not be converted.
     """
     try:
-        return struct.pack('>I', val)
+        return _UINT.pack(val)
     except struct.error as e:
         raise BuildError('Wrong argument value passed: {}'.format(e))
 
@@ -349,12 +415,9 @@ def get_rgba(dgram: bytes, start_index: int) -> Tuple[bytes, int]:
       ParseError if the datagram could not be parsed.
     """
     try:
-        if len(dgram[start_index:]) < _INT_DGRAM_LEN:
+        if _remaining(dgram, start_index) < _INT_DGRAM_LEN:
             raise ParseError('Datagram is too short')
-        return (
-            struct.unpack('>I',
-                          dgram[start_index:start_index + _INT_DGRAM_LEN])[0],
-            start_index + _INT_DGRAM_LEN)
+        return _UINT.unpack_from(dgram, start_index)[0], start_index + _INT_DGRAM_LEN
     except (struct.error, TypeError) as e:
         raise ParseError('Could not parse datagram %s' % e)
 
@@ -372,7 +435,7 @@ def write_midi(val: Tuple[Tuple[int, int, int, int], int]) -> bytes:
         raise BuildError('MIDI message length is invalid')
     try:
         value = sum((value & 0xFF) << 8 * (3 - pos) for pos, value in enumerate(val))
-        return struct.pack('>I', value)
+        return _UINT.pack(value)
     except struct.error as e:
         raise BuildError('Wrong argument value passed: {}'.format(e))
 
@@ -391,10 +454,9 @@ def get_midi(dgram: bytes, start_index: int) -> Tuple[Tuple[int, int, int, int],
       ParseError if the datagram could not be parsed.
     """
     try:
-        if len(dgram[start_index:]) < _INT_DGRAM_LEN:
+        if _remaining(dgram, start_index) < _INT_DGRAM_LEN:
             raise ParseError('Datagram is too short')
-        val = struct.unpack('>I',
-                            dgram[start_index:start_index + _INT_DGRAM_LEN])[0]
+        val = _UINT.unpack_from(dgram, start_index)[0]
         midi_msg = tuple((val & 0xFF << 8 * i) >> 8 * i for i in range(3, -1, -1))
         return (midi_msg, start_index + _INT_DGRAM_LEN)
     except (struct.error, TypeError) as e:
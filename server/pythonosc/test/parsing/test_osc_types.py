@@ -1,4 +1,5 @@
 """Unit tests for the osc_types module."""
+import struct
 import unittest
 
 from pythonosc.parsing import ntp
@@ -42,6 +43,15 @@ class TestString(unittest.TestCase):
         self.assertRaises(
             osc_types.ParseError, osc_types.get_string, b'abc\x00', -1)
 
+    def test_get_string_at_offset(self):
+        dgram = b"/SYNC\x00\x00\x00,s\x00\x00ABCDE\x00\x00\x00"
+        self.assertEqual(("ABCDE", 20), osc_types.get_string(dgram, 12))
+        self.assertEqual(("ABCDE", 20), osc_types.get_string(bytearray(dgram), 12))
+
+    def test_get_string_raises_when_not_terminated_at_offset(self):
+        self.assertRaises(
+            osc_types.ParseError, osc_types.get_string, b'ABC\x00DEFG', 4)
+
 
 class TestInteger(unittest.TestCase):
     def test_get_integer(self):
@@ -226,6 +236,15 @@ class TestFloat(unittest.TestCase):
         dgram = b'\x00' * 2
         self.assertEqual((0, 4), osc_types.get_float(dgram, 0))
 
+    def test_datagram_too_short_pads_at_offset(self):
+        dgram = b'\x00' * 4 + b'?\x80'
+        self.assertEqual((1.0, 8), osc_types.get_float(dgram, 4))
+
+    def test_get_float_at_offset(self):
+        dgram = b'\x00' * 4 + b'@\x00\x00\x00' + b'?\x80\x00\x00'
+        self.assertEqual((2.0, 8), osc_types.get_float(dgram, 4))
+        self.assertEqual((1.0, 12), osc_types.get_float(dgram, 8))
+
 
 class TestDouble(unittest.TestCase):
     def test_get_double(self):
@@ -295,6 +314,29 @@ class TestBlob(unittest.TestCase):
             osc_types.ParseError, osc_types.get_blob, b'\x00\x00\x00\x00', -1)
 
 
+class TestArray(unittest.TestCase):
+    def test_get_float_array(self):
+        dgram = b'\x00\x00\x00\x00' + struct.pack('>3f', 0.5, 1.5, -2.0)
+        values, index = osc_types.get_array(dgram, 4, 'f', 3)
+        self.assertEqual([0.5, 1.5, -2.0], list(values))
+        self.assertEqual(16, index)
+
+    def test_get_int_array(self):
+        dgram = bytearray(struct.pack('>3i', 1, -2, 3))
+        values, index = osc_types.get_array(dgram, 0, 'i', 3)
+        dgram[:4] = b'\x00' * 4
+        self.assertEqual([1, -2, 3], list(values))
+        self.assertEqual(12, index)
+
+    def test_get_array_raises_on_unsupported_type(self):
+        self.assertRaises(
+            osc_types.ParseError, osc_types.get_array, b'\x00' * 8, 0, 'd', 1)
+
+    def test_get_array_raises_too_short_buffer(self):
+        self.assertRaises(
+            osc_types.ParseError, osc_types.get_array, b'\x00' * 8, 0, 'f', 3)
+
+
 class TestNTPTimestamp(unittest.TestCase):
     def test_immediately_dgram(self):
         dgram = ntp.IMMEDIATELY
@@ -308,6 +350,10 @@ class TestNTPTimestamp(unittest.TestCase):
         dgram = b'\x00' * 8
         self.assertRaises(osc_types.ParseError, osc_types.get_date, dgram, 2)
 
+    def test_current_date(self):
+        date = 1792314678.5
+        self.assertEqual(date, osc_types.get_date(osc_types.write_date(date), 0)[0])
+
     def test_write_date(self):
         self.assertEqual(b'\x83\xaa~\x83\":)\xc7', osc_types.write_date(3.1337))
 
@@ -1,6 +1,10 @@
+import threading
+import time
 import unittest
 
 from pythonosc.dispatcher import Dispatcher, Handler
+from pythonosc import osc_bundle_builder
+from pythonosc import osc_message_builder
 
 
 class TestDispatcher(unittest.TestCase):
@@ -149,6 +153,124 @@ class TestDispatcher(unittest.TestCase):
         with self.assertRaises(ValueError) as context:
             self.dispatcher.unmap("/unmap/exception", handlerobj)
 
+    def test_handlers_in_mapping_order(self):
+        self.dispatcher.map('/*', 1)
+        self.dispatcher.map('/foo/bar', 2)
+        self.dispatcher.map('/foo/*', 3)
+        self.assertSequenceEqual(
+            [Handler(1, []), Handler(2, []), Handler(3, [])],
+            list(self.dispatcher.handlers_for_address("/foo/bar")))
+
+    def test_map_invalidates_cache(self):
+        self.dispatcher.map('/foo/bar', 1)
+        self.sortAndAssertSequenceEqual(
+            [Handler(1, [])], self.dispatcher.handlers_for_address("/foo/bar"))
+        self.dispatcher.map('/foo/*', 2)
+        self.sortAndAssertSequenceEqual(
+            [Handler(1, []), Handler(2, [])], self.dispatcher.handlers_for_address("/foo/bar"))
+
+    def test_unmap_invalidates_cache(self):
+        handlerobj = self.dispatcher.map('/foo/*', 1)
+        self.sortAndAssertSequenceEqual(
+            [Handler(1, [])], self.dispatcher.handlers_for_address("/foo/bar"))
+        self.dispatcher.unmap('/foo/*', handlerobj)
+        self.sortAndAssertSequenceEqual([], self.dispatcher.handlers_for_address("/foo/bar"))
+
+    def test_set_default_handler_invalidates_cache(self):
+        self.sortAndAssertSequenceEqual([], self.dispatcher.handlers_for_address("/test"))
+        self.dispatcher.set_default_handler(1)
+        self.sortAndAssertSequenceEqual([Handler(1, [])], self.dispatcher.handlers_for_address("/test"))
+        self.dispatcher.set_default_handler(None)
+        self.sortAndAssertSequenceEqual([], self.dispatcher.handlers_for_address("/test"))
+
+    def test_cache_is_bounded(self):
+        dispatcher = Dispatcher(cache_size=2)
+        dispatcher.map('/*', 1)
+        for address in ('/a', '/b', '/c', '/b'):
+            self.sortAndAssertSequenceEqual([Handler(1, [])], dispatcher.handlers_for_address(address))
+        self.assertEqual(['/c', '/b'], list(dispatcher._cache))
+
+    def test_array_threshold(self):
+        received = []
+        builder = osc_message_builder.OscMessageBuilder('/points')
+        for value in (1.0, 2.0, 3.0, 4.0):
+            builder.add_arg(value)
+        dgram = builder.build().dgram
+        for threshold in (0, 4):
+            dispatcher = Dispatcher(array_threshold=threshold)
+            dispatcher.map('/points', lambda address, *args: received.append(args))
+            dispatcher.call_handlers_for_packet(dgram, ('127.0.0.1', 0))
+        self.assertEqual((1.0, 2.0, 3.0, 4.0), received[0])
+        self.assertEqual(1, len(received[1]))
+        self.assertEqual([1.0, 2.0, 3.0, 4.0], list(received[1][0]))
+
+
+class TestScheduler(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.dispatcher = Dispatcher()
+        self.received = []
+        self.done = threading.Event()
+        self.dispatcher.map('/timed', self.handler)
+
+    def tearDown(self):
+        self.dispatcher.scheduler.stop(1)
+        super().tearDown()
+
+    def handler(self, address, *args):
+        self.received.append(args[0])
+        if len(self.received) == 3:
+            self.done.set()
+
+    def bundle(self, timestamp, value):
+        bundle = osc_bundle_builder.OscBundleBuilder(timestamp)
+        msg = osc_message_builder.OscMessageBuilder('/timed')
+        msg.add_arg(value)
+        bundle.add_content(msg.build())
+        return bundle.build().dgram
+
+    def test_future_bundle_does_not_block(self):
+        # far in the future, so it can not be released while the test runs
+        self.dispatcher.call_handlers_for_packet(self.bundle(time.time() + 60, 1), None)
+        self.assertEqual(1, self.dispatcher.scheduler.pending)
+        self.dispatcher.call_handlers_for_packet(self.bundle(osc_bundle_builder.IMMEDIATELY, 2), None)
+        self.assertEqual([2], self.received)
+        self.assertEqual(1, self.dispatcher.scheduler.pending)
+
+    def test_released_in_due_order(self):
+        now = time.time()
+        for delay, value in ((0.15, 3), (0.05, 1), (0.1, 2)):
+            self.dispatcher.call_handlers_for_packet(self.bundle(now + delay, value), None)
+        self.assertTrue(self.done.wait(10))
+        self.assertEqual([1, 2, 3], self.received)
+        stats = self.dispatcher.scheduler.stats()
+        self.assertEqual(0, stats['pending'])
+        self.assertEqual(3, stats['max_pending'])
+        self.assertEqual(3, stats['released'])
+        self.assertGreaterEqual(stats['max_lateness'], stats['mean_lateness'])
+
+    def test_latency_offset(self):
+        # a negative offset bringing the timetag into the past executes the message now
+        self.dispatcher.latency_offset = -60
+        self.dispatcher.call_handlers_for_packet(self.bundle(time.time() + 30, 1), None)
+        self.assertEqual([1], self.received)
+        self.assertEqual(0, self.dispatcher.scheduler.pending)
+        # a positive offset delays a message that is almost due
+        self.dispatcher.latency_offset = 60
+        self.dispatcher.call_handlers_for_packet(self.bundle(time.time() + 0.01, 2), None)
+        self.assertEqual([1], self.received)
+        self.assertEqual(1, self.dispatcher.scheduler.pending)
+
+    def test_stop_drops_pending_messages(self):
+        scheduler = self.dispatcher.scheduler
+        self.dispatcher.call_handlers_for_packet(self.bundle(time.time() + 60, 1), None)
+        self.assertEqual(1, scheduler.pending)
+        scheduler.stop(10)
+        self.assertIsNone(scheduler._thread)
+        self.assertEqual(0, scheduler.pending)
+        self.assertEqual(0, scheduler.stats()['released'])
+        self.assertEqual([], self.received)
+
 
 if __name__ == "__main__":
     unittest.main()
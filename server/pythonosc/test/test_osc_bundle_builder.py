@@ -1,5 +1,6 @@
 import unittest
 
+from pythonosc import osc_bundle
 from pythonosc import osc_bundle_builder
 from pythonosc import osc_message_builder
 
@@ -40,6 +41,38 @@ class TestOscBundleBuilder(unittest.TestCase):
         bundle = bundle.build()
         self.assertEqual(5, bundle.num_contents)
 
+    def test_build_bundles_splits_below_max_size(self):
+        msg = osc_message_builder.OscMessageBuilder(address="/SYNC")
+        msg.add_arg(4.0)
+        msg = msg.build()
+        # 16 bytes of header, then 4 + 16 bytes per message.
+        bundles = osc_bundle_builder.build_bundles(
+            [msg] * 7, 16 + 3 * 20, osc_bundle_builder.IMMEDIATELY)
+        self.assertEqual([3, 3, 1], [bundle.num_contents for bundle in bundles])
+        for bundle in bundles:
+            self.assertLessEqual(bundle.size, 16 + 3 * 20)
+
+    def test_build_bundles_oversized_content(self):
+        msg = osc_message_builder.OscMessageBuilder(address="/SYNC")
+        msg.add_arg("x" * 100)
+        msg = msg.build()
+        bundles = osc_bundle_builder.build_bundles([msg, msg], 64)
+        self.assertEqual([1, 1], [bundle.num_contents for bundle in bundles])
+
+    def test_build_bundles_empty(self):
+        self.assertEqual([], osc_bundle_builder.build_bundles([], 1024))
+
+    def test_build_bundles_as_dgrams(self):
+        msg = osc_message_builder.OscMessageBuilder(address="/SYNC")
+        msg.add_arg(4.0)
+        dgrams = osc_bundle_builder.build_bundles(
+            [msg.build_dgram(), msg.build()] * 2, 16 + 2 * 20, as_dgrams=True)
+        self.assertEqual(2, len(dgrams))
+        for dgram in dgrams:
+            bundle = osc_bundle.OscBundle(dgram)
+            self.assertEqual(2, bundle.num_contents)
+            self.assertEqual([4.0], bundle.content(0).params)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,3 +1,4 @@
+import struct
 import unittest
 
 from pythonosc import osc_message
@@ -143,6 +144,65 @@ class TestOscMessage(unittest.TestCase):
         self.assertEqual(1, len(msg.params))
         self.assertEqual(512, len(msg.params[0]))
 
+    def test_parse_many_float_params(self):
+        values = [float(i) for i in range(1000)]
+        dgram = (b"/points\x00" + b"," + b"f" * 1000 + b"\x00" * 3 +
+                 struct.pack('>1000f', *values))
+        msg = osc_message.OscMessage(dgram)
+        self.assertEqual("/points", msg.address)
+        self.assertEqual(values, msg.params)
+
+    def test_signature_decoder_matches_per_argument_parsing(self):
+        dgram = (b"/SYNC\x00\x00\x00"
+                 b",ifdr\x00\x00\x00"
+                 b"\xff\xff\xff\xfe"  # -2
+                 b"@\x00\x00\x00"  # 2.0
+                 b"@\x00\x00\x00\x00\x00\x00\x00"  # 2.0
+                 b"\xf0\x00\xff\x00")  # 4026597120
+        decoded = osc_message.OscMessage(dgram).params
+        decoders = osc_message.OscMessage.signature_decoders
+        osc_message.OscMessage.signature_decoders = osc_message.SignatureDecoders(maxsize=0)
+        try:
+            self.assertEqual(decoded, osc_message.OscMessage(dgram).params)
+        finally:
+            osc_message.OscMessage.signature_decoders = decoders
+        self.assertEqual([-2, 2.0, 2.0, 4026597120], decoded)
+
+    def test_array_threshold(self):
+        values = [float(i) for i in range(8)]
+        dgram = (b"/points\x00" + b",ffffffff\x00\x00\x00" +
+                 struct.pack('>8f', *values))
+        params = osc_message.OscMessage(dgram, array_threshold=8).params
+        mixed = osc_message.OscMessage(_DGRAM_ALL_STANDARD_TYPES_OF_PARAMS, array_threshold=8).params
+        self.assertEqual(1, len(params))
+        self.assertEqual(values, list(params[0]))
+        self.assertEqual(osc_message.OscMessage(_DGRAM_ALL_STANDARD_TYPES_OF_PARAMS).params, mixed)
+        self.assertEqual(values, osc_message.OscMessage(dgram).params)
+
+
+class TestSignatureDecoders(unittest.TestCase):
+    def test_fixed_width_signature(self):
+        decoders = osc_message.SignatureDecoders()
+        decoder = decoders.get('iffd')
+        self.assertEqual('>iffd', decoder.format)
+        self.assertIs(decoder, decoders.get('iffd'))
+        self.assertEqual((1, 1), (decoders.hits, decoders.misses))
+
+    def test_mixed_signature_has_no_decoder(self):
+        decoders = osc_message.SignatureDecoders()
+        self.assertIsNone(decoders.get('ifs'))
+        self.assertIsNone(decoders.get('f[f]'))
+        self.assertIsNone(decoders.get(''))
+        self.assertIsNone(decoders.get('ifs'))
+        self.assertEqual((1, 3), (decoders.hits, decoders.misses))
+
+    def test_bounded(self):
+        decoders = osc_message.SignatureDecoders(maxsize=2)
+        for signature in ('f', 'ff', 'f', 'fff', 'ff'):
+            decoders.get(signature)
+        self.assertEqual((1, 4), (decoders.hits, decoders.misses))
+        self.assertEqual(['fff', 'ff'], list(decoders._decoders))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -81,6 +81,57 @@ class TestOscMessageBuilder(unittest.TestCase):
         builder.add_arg(True)
         self.assertEqual(builder.args, [("i", 0), ("i", 1), ("F", False), ("T", True)])
 
+    def test_build_dgram_matches_build(self):
+        builder = osc_message_builder.OscMessageBuilder(address="/SYNC")
+        builder.add_arg(4.0)
+        builder.add_arg(2)
+        builder.add_arg("value")
+        builder.add_arg(True)
+        builder.add_arg(b"\x01\x02\x03")
+        builder.add_arg([1, ["abc"]])
+        builder.add_arg(4278255360, builder.ARG_TYPE_RGBA)
+        builder.add_arg((1, 145, 36, 125), builder.ARG_TYPE_MIDI)
+        builder.add_arg(1e-9, builder.ARG_TYPE_DOUBLE)
+        dgram = builder.build_dgram()
+        self.assertIsInstance(dgram, bytes)
+        self.assertEqual(builder.build().dgram, dgram)
+
+    def test_build_dgram_noarg_message(self):
+        dgram = osc_message_builder.OscMessageBuilder(address='/SYNC').build_dgram()
+        self.assertEqual(bytes.fromhex('2f53594e430000002c000000'), dgram)
+
+    def test_build_dgram_wrong_type_raises(self):
+        builder = osc_message_builder.OscMessageBuilder(address="/SYNC")
+        builder.add_arg('this is not a float', builder.ARG_TYPE_FLOAT)
+        self.assertRaises(osc_message_builder.BuildError, builder.build_dgram)
+
+
+class TestFixedSignatureBuilder(unittest.TestCase):
+    def test_build_dgram(self):
+        fixed = osc_message_builder.FixedSignatureBuilder("/SYNC", "fidr")
+        for values in ([4.0, 2, 1e-9, 4278255360], [-1.5, -3, 2.0, 0]):
+            builder = osc_message_builder.OscMessageBuilder(address="/SYNC")
+            builder.add_arg(values[0], builder.ARG_TYPE_FLOAT)
+            builder.add_arg(values[1], builder.ARG_TYPE_INT)
+            builder.add_arg(values[2], builder.ARG_TYPE_DOUBLE)
+            builder.add_arg(values[3], builder.ARG_TYPE_RGBA)
+            self.assertEqual(builder.build_dgram(), fixed.build_dgram(values))
+
+    def test_no_arguments(self):
+        fixed = osc_message_builder.FixedSignatureBuilder("/SYNC", "")
+        self.assertEqual(bytes.fromhex('2f53594e430000002c000000'), fixed.build_dgram([]))
+
+    def test_unsupported_type_raises(self):
+        self.assertRaises(ValueError, osc_message_builder.FixedSignatureBuilder, "/SYNC", "fs")
+
+    def test_no_address_raises(self):
+        self.assertRaises(osc_message_builder.BuildError, osc_message_builder.FixedSignatureBuilder, "", "f")
+
+    def test_wrong_values_raise(self):
+        fixed = osc_message_builder.FixedSignatureBuilder("/SYNC", "ff")
+        self.assertRaises(osc_message_builder.BuildError, fixed.build_dgram, [1.0])
+        self.assertRaises(osc_message_builder.BuildError, fixed.build_dgram, [1.0, 'no float'])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,3 +1,6 @@
+import socket
+import threading
+import time
 import unittest
 import unittest.mock
 
@@ -25,6 +28,33 @@ class TestOscServer(unittest.TestCase):
             osc_server._is_valid_request([b'']))
 
 
+class TestOSCUDPServer(unittest.TestCase):
+    def test_shutdown_wakes_serve_forever(self):
+        server = osc_server.BlockingOSCUDPServer(('127.0.0.1', 0), dispatcher.Dispatcher())
+        port = server.server_address[1]
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            # let serve_forever block in select
+            time.sleep(0.05)
+            start = time.monotonic()
+            server.shutdown()
+            elapsed = time.monotonic() - start
+            thread.join(5)
+        finally:
+            server.server_close()
+        self.assertFalse(thread.is_alive())
+        # the socketserver default poll interval is 0.5 seconds
+        self.assertLess(elapsed, 0.25)
+
+        # the port is released
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            sock.bind(('127.0.0.1', port))
+        finally:
+            sock.close()
+
+
 class TestUDPHandler(unittest.TestCase):
     def setUp(self):
         super().setUp()
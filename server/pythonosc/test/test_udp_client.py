@@ -18,6 +18,49 @@ class TestUdpClient(unittest.TestCase):
         self.assertTrue(mock_socket.sendto.called)
         mock_socket.sendto.assert_called_once_with(msg.dgram, ('::1', 31337))
 
+    @mock.patch('socket.socket')
+    def test_send_dgram(self, mock_socket_ctor):
+        mock_socket = mock_socket_ctor.return_value
+        client = udp_client.UDPClient('::1', 31337)
+
+        dgram = osc_message_builder.OscMessageBuilder('/').build_dgram()
+        client.send(dgram)
+
+        mock_socket.sendto.assert_called_once_with(dgram, ('::1', 31337))
+
+    @mock.patch('socket.getaddrinfo')
+    @mock.patch('socket.socket')
+    def test_send_connected(self, mock_socket_ctor, mock_getaddrinfo):
+        mock_socket = mock_socket_ctor.return_value
+        mock_getaddrinfo.return_value = [
+            (socket.AF_INET, socket.SOCK_DGRAM, 17, '', ('127.0.0.1', 31337))]
+        client = udp_client.UDPClient('localhost', 31337, connect=True, sndbuf=65536)
+
+        mock_getaddrinfo.assert_called_once_with('localhost', 31337, socket.AF_INET, socket.SOCK_DGRAM)
+        mock_socket_ctor.assert_called_once_with(socket.AF_INET, socket.SOCK_DGRAM, 17)
+        mock_socket.setsockopt.assert_called_once_with(socket.SOL_SOCKET, socket.SO_SNDBUF, 65536)
+        mock_socket.connect.assert_called_once_with(('127.0.0.1', 31337))
+
+        dgram = osc_message_builder.OscMessageBuilder('/').build_dgram()
+        client.send(dgram)
+        client.send(dgram)
+        self.assertEqual(1, mock_getaddrinfo.call_count)
+        self.assertEqual(2, mock_socket.send.call_count)
+        self.assertFalse(mock_socket.sendto.called)
+
+    @mock.patch('socket.getaddrinfo')
+    @mock.patch('socket.socket')
+    def test_send_connected_ignores_refused(self, mock_socket_ctor, mock_getaddrinfo):
+        mock_socket = mock_socket_ctor.return_value
+        mock_socket.send.side_effect = [ConnectionRefusedError, 4]
+        mock_getaddrinfo.return_value = [
+            (socket.AF_INET, socket.SOCK_DGRAM, 17, '', ('127.0.0.1', 31337))]
+        client = udp_client.UDPClient('127.0.0.1', 31337, connect=True)
+
+        dgram = osc_message_builder.OscMessageBuilder('/').build_dgram()
+        client.send(dgram)
+        self.assertEqual(2, mock_socket.send.call_count)
+
 
 class TestSimpleUdpClient(unittest.TestCase):
     def setUp(self):
@@ -1,6 +1,6 @@
 """Client to send OSC datagrams to an OSC server via UDP."""
 
-from collections import Iterable
+from collections.abc import Iterable
 import socket
 
 from .osc_message_builder import OscMessageBuilder
@@ -12,22 +12,58 @@ from typing import Union
 class UDPClient(object):
     """OSC client to send OscMessages or OscBundles via UDP."""
 
-    def __init__(self, address: str, port: int, allow_broadcast: bool = False):
+    def __init__(self, address: str, port: int, allow_broadcast: bool = False,
+                 connect: bool = False, sndbuf: int = None):
         """Initialize the client.
 
         As this is UDP it will not actually make any attempt to connect to the
         given server at ip:port until the send() method is called.
+
+        Args:
+          - connect: Resolve the address once (IPv4 only, like the socket
+                  used without connect) and connect the socket to it,
+                  so datagrams are sent without resolving and checking the
+                  destination every time. Datagrams refused by the server
+                  (nobody listening) are ignored.
+          - sndbuf: Size in bytes of the send buffer of the socket.
         """
-        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        if connect:
+            family, type_, proto, _, destination = socket.getaddrinfo(
+                address, port, socket.AF_INET, socket.SOCK_DGRAM)[0]
+            self._sock = socket.socket(family, type_, proto)
+        else:
+            self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self._sock.setblocking(0)
         if allow_broadcast:
             self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        if sndbuf:
+            self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, sndbuf)
+        if connect:
+            self._sock.connect(destination)
+        self._connected = connect
         self._address = address
         self._port = port
 
-    def send(self, content: osc_message.OscMessage) -> None:
-        """Sends an OscBundle or OscMessage to the server."""
-        self._sock.sendto(content.dgram, (self._address, self._port))
+    def send(self, content: Union[osc_message.OscMessage, bytes]) -> None:
+        """Sends an OscBundle, an OscMessage or a raw datagram to the server."""
+        if not isinstance(content, (bytes, bytearray)):
+            content = content.dgram
+        if not self._connected:
+            self._sock.sendto(content, (self._address, self._port))
+            return
+        try:
+            self._sock.send(content)
+        except ConnectionRefusedError:
+            # Reported for a previous datagram, the server was not listening
+            # yet. The error is now cleared: try again once.
+            try:
+                self._sock.send(content)
+            except ConnectionRefusedError:
+                pass
+
+    def close(self) -> None:
+        """Closes the socket of the client."""
+        self._sock.close()
 
 
 class SimpleUDPClient(UDPClient):
@@ -23,6 +23,7 @@ from oscpy.server import OSCThreadServer
 from pythonosc import osc_message_builder
 from pythonosc import udp_client
 from pythonosc import osc_bundle
+from pythonosc import osc_bundle_builder
 from pythonosc import osc_message
 from pythonosc import osc_packet
 from pythonosc import dispatcher
@@ -59,19 +60,16 @@ class OSC_OT_OSCPyServer(OSC_OT_OSCServer):
  
     # setup the receiving server
     def setupOutputServer(self, context, envars):
-        #For sending
-        self.outputServer = OSCClient(envars.udp_out, envars.port_out)
+        #For sending, the destination is resolved once and the socket connected to it
+        self.outputServer = OSCClient(envars.udp_out, envars.port_out, connect=True, sndbuf=envars.output_sndbuf or None)
         self.outputServer.send_message(b'/NodeOSC', [b'Python server started up'])     
         print("OSCPy Server sended test message to " + envars.udp_out + " on port " + str(envars.port_out))
 
-    def sendingOSC(self, context, event):
+    # called by the sender thread
+    def transmitOSC(self, oscMessage, bundleSize):
 
-        oscMessage = {}
-        
-        # gather all the ouput bound osc messages
-        make_osc_messages(bpy.context.scene.NodeOSC_outputs, oscMessage)
-         
-        # and send them 
+        # prepare the messages for sending
+        messages = []
         for key, args in oscMessage.items():
             values = []
             if isinstance(args, (tuple, list)):
@@ -83,7 +81,15 @@ class OSC_OT_OSCPyServer(OSC_OT_OSCServer):
                 if type(args) == str:
                     args = bytes(args, encoding='utf-8')
                 values.append(args)
-            self.outputServer.send_message(bytes(key, encoding='utf-8'), values)
+            messages.append((bytes(key, encoding='utf-8'), values))
+
+        # and send them 
+        if bundleSize:
+            if messages:
+                self.outputServer.send_bundles(messages, bundleSize)
+        elif messages:
+            # one datagram per message, in as few system calls as possible
+            self.outputServer.send_many(messages)
   
     # add method 
     def addMethod(self, address, data):
@@ -98,7 +104,10 @@ class OSC_OT_OSCPyServer(OSC_OT_OSCServer):
         print("Create OscPy Thread...")
         # creating a blocking UDP Server
         #   Each message will be handled sequentially on the same thread.
-        self.inputServer = OSCThreadServer(encoding='utf8', default_handler=OSC_callback_oscpy)
+        #   The thread sleeps until a message arrives (timeout=None).
+        self.inputServer = OSCThreadServer(encoding='utf8', default_handler=OSC_callback_oscpy, recv_into=True, batch_size=64, timeout=None,
+                                           array_threshold=envars.input_array_threshold,
+                                           schedule_bundles=True, latency_offset=envars.input_timetag_offset / 1000)
         sock = self.inputServer.listen(address=envars.udp_in, port=envars.port_in, default=True)
         print("... server started on ", envars.port_in)
 
@@ -106,13 +115,24 @@ class OSC_OT_OSCPyServer(OSC_OT_OSCServer):
     def shutDownInputServer(self, context, envars):
         self.inputServer.stop_all()             # Stop all sockets
         self.inputServer.terminate_server()     # Request the handler thread to stop looping
+        self.inputServer.join_server(1)         # and wait for it
         print("OSCPy Server is shutdown")
+
+    # stop sending
+    def shutDownOutputServer(self, context, envars):
+        self.outputServer.close()
  
  
 #######################################
 #  Setup PythonOSC Server             #
 #######################################
 
+# argument types of the output values that can use a FixedSignatureBuilder
+FIXED_ARG_TYPES = {
+    float: osc_message_builder.OscMessageBuilder.ARG_TYPE_FLOAT,
+    int: osc_message_builder.OscMessageBuilder.ARG_TYPE_INT,
+}
+
 class OSC_OT_PythonOSCServer(OSC_OT_OSCServer):
     bl_idname = "nodeosc.pythonosc_operator"
     bl_label = "OSCMainThread"
@@ -125,39 +145,54 @@ class OSC_OT_PythonOSCServer(OSC_OT_OSCServer):
 
     inputServer = "" #for the receiving socket
     outputServer = "" #for the sending socket
+    outputBuilders = None #reused message builders, per address and signature
     dispatcher = "" #dispatcher function
             
     # setup the sending server
     def setupInputServer(self, context, envars):
-        self.dispatcher = dispatcher.Dispatcher()   
+        self.dispatcher = dispatcher.Dispatcher(latency_offset=envars.input_timetag_offset / 1000,
+                                                array_threshold=envars.input_array_threshold)
  
     # setup the receiving server
     def setupOutputServer(self, context, envars):
-        #For sending
-        self.outputServer = udp_client.UDPClient(envars.udp_out, envars.port_out)
+        #For sending, the destination is resolved once and the socket connected to it
+        self.outputServer = udp_client.UDPClient(envars.udp_out, envars.port_out, connect=True, sndbuf=envars.output_sndbuf or None)
+        self.outputBuilders = {}
         msg = osc_message_builder.OscMessageBuilder(address="/NodeOSC")
         msg.add_arg("Python server started up")
         msg = msg.build()
         self.outputServer.send(msg)     
         print("Python Server sended test message to " + envars.udp_out + " on port " + str(envars.port_out))
 
-    def sendingOSC(self, context, event):
+    # called by the sender thread
+    def transmitOSC(self, oscMessage, bundleSize):
 
-        oscMessage = {}
-        
-        # gather all the ouput bound osc messages
-        make_osc_messages(bpy.context.scene.NodeOSC_outputs, oscMessage)
-         
-        # and send them 
+        # build the messages
+        messages = []
+        builders = self.outputBuilders
         for key, args in oscMessage.items():
-            msg = osc_message_builder.OscMessageBuilder(address=key)
-            if isinstance(args, (tuple, list)):
+            if not isinstance(args, (tuple, list)):
+                args = (args,)
+            # numbers only messages reuse a builder per address and signature
+            signature = ''.join(FIXED_ARG_TYPES.get(type(argum), '?') for argum in args)
+            if '?' not in signature:
+                builder = builders.get((key, signature))
+                if builder is None:
+                    builder = builders[(key, signature)] = osc_message_builder.FixedSignatureBuilder(key, signature)
+                messages.append(builder.build_dgram(args))
+            else:
+                msg = osc_message_builder.OscMessageBuilder(address=key)
                 for argum in args:
                     msg.add_arg(argum)
-            else:
-                msg.add_arg(args)
-            msg = msg.build()
-            self.outputServer.send(msg)
+                messages.append(msg.build_dgram())
+
+        # and send them 
+        if bundleSize:
+            for bundle in osc_bundle_builder.build_bundles(messages, bundleSize, as_dgrams=True):
+                self.outputServer.send(bundle)
+        else:
+            for msg in messages:
+                self.outputServer.send(msg)
   
     # add method 
     def addMethod(self, address, data):
@@ -183,7 +218,13 @@ class OSC_OT_PythonOSCServer(OSC_OT_OSCServer):
     # stop receiving
     def shutDownInputServer(self, context, envars):
         self.inputServer.shutdown()
+        self.inputServer.server_close()         # Release the port
+        self.dispatcher.scheduler.stop()        # Drop the messages of future bundles
         print("Python Server is shutdown")
+
+    # stop sending
+    def shutDownOutputServer(self, context, envars):
+        self.outputServer.close()
  
  
 panel_classes = (
@@ -46,7 +46,19 @@ class OSC_PT_Settings(bpy.types.Panel):
                 row2.prop(envars, 'udp_out', text="Out")
                 row2.prop(envars, 'port_out', text="Port")
                 col.prop(envars, 'input_rate', text="input rate(ms)")
+                row4 = col.row(align=True)
+                row4.prop(envars, 'input_latency_max', text="max latency(ms)")
+                row4.prop(envars, 'input_cpu_max', text="max cpu")
+                col.prop(envars, 'input_array_threshold', text="input array threshold")
+                col.prop(envars, 'input_timetag_offset', text="timetag offset(ms)")
+                col.prop(envars, 'output_trigger', text="send outputs")
                 col.prop(envars, 'output_rate', text="output rate(ms)")
+                col.prop(envars, 'output_deadband', text="output deadband")
+                row3 = col.row(align=True)
+                row3.prop(envars, 'output_bundle', text="Send bundles")
+                if envars.output_bundle:
+                    row3.prop(envars, 'output_bundle_size', text="max size")
+                col.prop(envars, 'output_sndbuf', text="send buffer(bytes)")
                 col.prop(envars, 'repeat_filter', text="Filter repetitions. Overrides indivdual handler settings.")
                 col.prop(envars, 'autorun', text="Start at Launch")
         else:
@@ -73,7 +85,10 @@ class OSC_PT_Settings(bpy.types.Panel):
                     box = col.box()
                     row5 = box.column(align=True)
                     row5.label(text = "input: " + prettyTime(envars.executionTimeInput), icon = "TIME")
+                    row5.label(text = "input interval: " + prettyTime(envars.input_interval / 1000), icon = "TIME")
                     row5.label(text = "output: " + prettyTime(envars.executionTimeOutput), icon = "TIME")
+                    if envars.output_trigger == 'TIMER':
+                        row5.label(text = "output rates: " + envars.output_rates, icon = "TIME")
                     row6 = box.column(align=True)
                     if addon_prefs.usePyLiblo == False:
                         row6.label(text="Last OSC message:")
@@ -176,6 +191,17 @@ class OSC_PT_Operations(bpy.types.Panel):
                     if item.loop_enable:
                         colLabel.label(text='')
                         colData.prop(item,'loop_range',text='range')    
+
+                if item.osc_direction != "OUTPUT":
+                    colLabel.label(text='delivery')
+                    delivery_row = colData.row(align = True)
+                    delivery_row.prop(item, 'delivery', text='')
+                    if item.delivery != "LATEST":
+                        delivery_row.prop(item, 'delivery_size', text='size')
+
+                if item.osc_direction != "INPUT":
+                    colLabel.label(text='rate(ms)')
+                    colData.prop(item, 'rate', text='')
                                               
             index = index + 1
         
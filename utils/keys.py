@@ -21,6 +21,9 @@ class NodeOSCMsgValues(bpy.types.PropertyGroup):
         ui_expanded: bpy.props.BoolProperty(name="Expanded", default=True)
         node_data_type: bpy.props.EnumProperty(name = "Node data type", default = "LIST", items = nodeDataTypeItems)
         node_type: bpy.props.IntProperty(name = "Node type", default = 0)
+        delivery: bpy.props.EnumProperty(name = "Delivery", default = "LATEST", items = deliveryItems, description = "How messages that arrive between two updates are delivered")
+        delivery_size: bpy.props.IntProperty(name = "Size", default = 16, min = 1, description = "Number of messages kept between two updates for bounded delivery. For unbounded delivery this is the preallocated size")
+        rate: bpy.props.IntProperty(name = "Rate", default = 0, min = 0, description = "The interval between two checks of this output for changes (millisecond). 0 uses the global output rate")
 
 key_classes = (
     NodeOSCMsgValues,
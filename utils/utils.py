@@ -13,6 +13,11 @@ nodeDataTypeItems = {
     ("LIST", "List", "Expects List", "IMPORT", 0),
     ("SINGLE", "Single", "Expects single value", "IMPORT", 1) } 
 
+deliveryItems = {
+    ("LATEST", "Latest", "Only the last message received between two updates is applied (ideal for continuous values)", "NONE", 0),
+    ("FIFO", "All", "All messages are applied in the order they arrived, none is dropped (ideal for events and triggers)", "NONE", 1),
+    ("FIFO_BOUNDED", "Bounded", "Messages are applied in the order they arrived, only the last 'size' messages between two updates are kept", "NONE", 2) }
+
 nodeTypeItems = {
     ("NONE", 0),
     ("AN", 1),